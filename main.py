@@ -1,14 +1,27 @@
 from src.logging_config import setup_logging
 from src.telegram_bot import run_bot
 from src.tools.fetch_url import close_browser
+from src.tools.http_client import close_shared_session
+from src.tools.bsky import close_client as close_bsky_client
+from src.tools.geocoding import close_geocoder
+from src.ollama_transport import ollama_http_client, warm_up_ollama
+from src.settings import OllamaEndpoints
 import asyncio
 
 
 async def main():
+    # Warm the Ollama pool while the bot starts polling; best effort, so it
+    # runs detached and can never cancel the bot
+    warm_up = asyncio.create_task(warm_up_ollama(str(OllamaEndpoints.API_ROOT)))
     try:
         await run_bot()
     finally:
+        warm_up.cancel()
         await close_browser()
+        await close_shared_session()
+        await close_bsky_client()
+        await close_geocoder()
+        await ollama_http_client.aclose()
 
 
 if __name__ == "__main__":
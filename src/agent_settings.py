@@ -1,8 +1,22 @@
 import os
 from dataclasses import dataclass, field
+from functools import cache, cached_property
 
 from .settings import OLLAMA_NUM_CTX, OllamaEndpoints, PROMPT_PATH
 
+OLLAMA_CHAT_URL = str(OllamaEndpoints.CHAT)
+
+
+@cache
+def ollama_provider():
+    """One OpenAI-compatible client for every agent model, built on first use."""
+    from pydantic_ai.providers.ollama import OllamaProvider
+    from .ollama_transport import ollama_http_client
+    return OllamaProvider(
+        base_url=OLLAMA_CHAT_URL,
+        http_client=ollama_http_client,
+    )
+
 
 @dataclass
 class AgentSettings:
@@ -30,20 +44,16 @@ class AgentSettings:
             body["think"] = False
         return {"extra_body": body}
 
-    @property
+    @cached_property
     def instructions(self) -> str:
+        # Read once per process; every agent built for this role reuses the text
         return PROMPT_PATH.joinpath(self.prompt_file).read_text()
 
     def make_model(self):
         from pydantic_ai.models.openai import OpenAIChatModel
-        from pydantic_ai.providers.ollama import OllamaProvider
-        from .ollama_transport import ollama_http_client
         return OpenAIChatModel(
             model_name=self.model,
-            provider=OllamaProvider(
-                base_url=str(OllamaEndpoints.CHAT),
-                http_client=ollama_http_client,
-            )
+            provider=ollama_provider(),
         )
 
 
@@ -1,15 +1,23 @@
 import re
+import time
 import asyncio
 import logging
+import threading
 from datetime import datetime
 from zoneinfo import ZoneInfo
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from typing import Callable, Awaitable, Dict, List
 
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.exceptions import UnexpectedModelBehavior, ModelHTTPError
+from pydantic_ai.messages import ModelRequest, ModelResponse, UserPromptPart, TextPart
 from .settings import (
-        LOG_DIR
+        LOG_DIR,
+        NUNTIUS_CANDIDATES,
+        SKIP_REFLECTION, SKIP_SHORT_REVIEW,
+        FAST_PATH_MAX_WORDS, NUNTIUS_STREAM_INTERVAL,
+        MAX_CHATS, SPECULATIVE_REDRAFT,
     )
 from .agent_settings import AgentsConfiguration
 from .chat_history import ChatHistoryManager
@@ -18,6 +26,17 @@ from .training_logger import TrainingLogger
 
 logger = logging.getLogger(__name__)
 
+_THINK_RE = re.compile(r'<think>.*?</think>\s*', re.DOTALL)
+# Gemma-style visible thinking preambles that bracket the model's
+# chain-of-thought before the answer begins
+_GEMMA_THINKING_RE = re.compile(
+    r'^\s*Thinking(?:\.\.\.|…)\s*.*?(?:\.\.\.|…)?\s*done thinking\.\s*',
+    re.DOTALL | re.IGNORECASE,
+)
+_THOUGHT_RE = re.compile(r'<thought>.*?</thought>\s*', re.DOTALL)
+_MODEL_TAG_RE = re.compile(r'<model>(.*?)</model>', re.DOTALL)
+_SPECIAL_TOKEN_RE = re.compile(r'<\|(?:endoftext|im_start)\|>.*', re.DOTALL)
+_BOXED_RE = re.compile(r'\s*\\boxed\{[^}]*\}')
 
 
 def strip_think_tags(text: str) -> str:
@@ -26,29 +45,34 @@ def strip_think_tags(text: str) -> str:
     Gemma-family models may emit a visible plain-text thinking preamble such as
     "Thinking..." followed by "...done thinking." before the real answer.
     """
-    # Strip Gemma-style visible thinking preambles when they clearly bracket the
-    # model's chain-of-thought before the answer begins.
-    text = re.sub(
-        r'^\s*Thinking(?:\.\.\.|…)\s*.*?(?:\.\.\.|…)?\s*done thinking\.\s*',
-        '',
-        text,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
-    text = re.sub(r'<think>.*?</think>\s*', '', text, flags=re.DOTALL)
+    text = _GEMMA_THINKING_RE.sub('', text)
+    if '<think>' in text:
+        text = _THINK_RE.sub('', text)
     if '</think>' in text:
         text = text.split('</think>', 1)[-1]
     # Strip <thought>...</thought> wrapper tags
-    text = re.sub(r'<thought>.*?</thought>\s*', '', text, flags=re.DOTALL)
+    text = _THOUGHT_RE.sub('', text)
     # Unwrap <model>...</model> tags, preserving inner content (e.g. "APPROVED:")
-    text = re.sub(r'<model>(.*?)</model>', r'\1', text, flags=re.DOTALL)
+    text = _MODEL_TAG_RE.sub(r'\1', text)
     # Remove any trailing garbage after endoftext/im_start tokens
-    text = re.sub(r'<\|endoftext\|>.*', '', text, flags=re.DOTALL)
-    text = re.sub(r'<\|im_start\|>.*', '', text, flags=re.DOTALL)
+    text = _SPECIAL_TOKEN_RE.sub('', text)
     # Strip \boxed{...} LaTeX artifacts (Qwen math training bleed)
-    text = re.sub(r'\s*\\boxed\{[^}]*\}', '', text)
+    text = _BOXED_RE.sub('', text)
     return text.strip()
 
 
+STRIP_IN_THREAD_CHARS = 4096
+
+
+async def strip_think_tags_async(text: str) -> str:
+    """strip_think_tags for the event loop: long outputs are cleaned in a
+    worker thread so regex passes over large drafts don't stall other chats.
+    """
+    if len(text) > STRIP_IN_THREAD_CHARS:
+        return await asyncio.to_thread(strip_think_tags, text)
+    return strip_think_tags(text)
+
+
 #                          User Query
 #                               │
 #                  ┌────────────┴────────────┐
@@ -128,13 +152,30 @@ MAX_FINDINGS_CHARS = 12000  # ~3K tokens; cap narrative summary accumulation
 
 MAX_SPECIAL_RETRIES = 2
 
+RESEARCH_PROMPT = (
+    "Research Directives:\n{directive}\n\n"
+    "IMPORTANT: Complete ONLY the above directives. "
+    "Do not research unrelated topics."
+)
+
+_UTC = ZoneInfo("UTC")
+_date_cache: tuple[int, str] = (-1, "")  # (UTC epoch day, formatted date)
+
+
+def _today_utc() -> str:
+    """Return today's UTC date string, reformatting only when the day rolls over."""
+    global _date_cache
+    day = int(time.time() // 86400)
+    if _date_cache[0] != day:
+        current_date = datetime.fromtimestamp(day * 86400, tz=_UTC).strftime("%B %d, %Y")
+        _date_cache = (day, current_date)
+    return _date_cache[1]
+
+
 def inject_date(agent: Agent) -> None:
     @agent.instructions
     def add_date() -> str:
-        current_date = datetime.now(
-            tz=ZoneInfo("UTC")
-        ).strftime("%B %d, %Y")
-        return f"Today's date is {current_date}"
+        return f"Today's date is {_today_utc()}"
 
 
 def inject_tool_list(agent: Agent, toolset, extra_tools: list | None = None) -> None:
@@ -169,9 +210,22 @@ MAX_RESEARCH_CALLS = 5   # initial + 4 follow-ups
 MAX_REVIEW_CALLS = 3     # write + up to 2 revisions
 MAX_SPECIAL_RETRIES = 2  # retries for tool errors in Praetor before giving up
 MAX_GAP_RESEARCH_CALLS = 2  # max follow-up research rounds for gap-filling
+MAX_PARALLEL_DIRECTIVES = 3  # run_parallel_research fan-out (each runs up to 2 agents)
+MIN_REVIEW_CHARS = 300      # with SKIP_SHORT_REVIEW, shorter drafts skip review unless they hedge
+
+_HEDGE_RE = re.compile(
+    r"\b(?:i'?m not sure|not certain|unable to|could not find|couldn'?t find"
+    r"|no (?:information|results|sources)|unclear)\b",
+    re.IGNORECASE,
+)
+
+
+def looks_final(draft: str) -> bool:
+    """Cheap pre-review heuristic: short, non-hedging drafts don't need Cogitator."""
+    return len(draft) < MIN_REVIEW_CHARS and not _HEDGE_RE.search(draft)
 
 
-@dataclass
+@dataclass(slots=True)
 class CallCounter:
     max_calls: int
     count: int = 0
@@ -182,7 +236,7 @@ class CallCounter:
         return self.count > self.max_calls
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchObjective:
     description: str
     tool_names: List[str]
@@ -190,7 +244,7 @@ class ResearchObjective:
     findings_summary: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchPlan:
     query: str
     objectives: List[ResearchObjective] = field(default_factory=list)
@@ -218,7 +272,7 @@ class ResearchPlan:
             ]
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentDeps:
     update_chat: Callable[[str], Awaitable[None]]
     user_input: str = ""
@@ -271,11 +325,7 @@ class Explorator:
         while not deps.web_research_counter.calls_exhausted():
             try:
                 return await self.agent.run(
-                    user_prompt=(
-                        f"Research Directives:\n{directive}\n\n"
-                        f"IMPORTANT: Complete ONLY the above directives. "
-                        f"Do not research unrelated topics."
-                    ),
+                    user_prompt=RESEARCH_PROMPT.format(directive=directive),
                     deps=deps,
                     model_settings=AgentsConfiguration.EXPLORATOR.model_settings,
                 )
@@ -311,11 +361,7 @@ class Tabularius:
         while not deps.data_research_counter.calls_exhausted():
             try:
                 return await self.agent.run(
-                    user_prompt=(
-                        f"Research Directives:\n{directive}\n\n"
-                        f"IMPORTANT: Complete ONLY the above directives. "
-                        f"Do not research unrelated topics."
-                    ),
+                    user_prompt=RESEARCH_PROMPT.format(directive=directive),
                     deps=deps,
                     model_settings=AgentsConfiguration.TABULARIUS.model_settings,
                 )
@@ -340,14 +386,28 @@ class Nuntius:
         user_input: str,
         research: str,
         model_settings: dict | None = None,
+        on_progress: Callable[[str], Awaitable[None]] | None = None,
     ) -> str:
-        """Write a sourced response from research findings."""
-        result = await self.agent.run(
-            user_prompt=f"User Question: {user_input}\n\n{research}",
-            model_settings=model_settings or AgentsConfiguration.NUNTIUS.model_settings,
-        )
-        output = strip_think_tags(result.output)
-        return output
+        """Write a sourced response from research findings.
+
+        When ``on_progress`` is given and NUNTIUS_STREAM_INTERVAL is set, the
+        draft is streamed and ``on_progress`` receives the partial text at
+        most once per interval.
+        """
+        user_prompt = f"User Question: {user_input}\n\n{research}"
+        model_settings = model_settings or AgentsConfiguration.NUNTIUS.model_settings
+        if on_progress is None or NUNTIUS_STREAM_INTERVAL <= 0:
+            result = await self.agent.run(user_prompt=user_prompt, model_settings=model_settings)
+            return await strip_think_tags_async(result.output)
+        async with self.agent.run_stream(user_prompt=user_prompt, model_settings=model_settings) as result:
+            last_update = time.monotonic()
+            async for partial in result.stream_text(debounce_by=None):
+                now = time.monotonic()
+                if now - last_update >= NUNTIUS_STREAM_INTERVAL:
+                    last_update = now
+                    await on_progress(partial)
+            output = await result.get_output()
+        return await strip_think_tags_async(output)
 
 
 class Cogitator:
@@ -371,7 +431,7 @@ class Cogitator:
             user_prompt=f"Original Question: {user_input}\n\nDraft Response:\n{draft}",
             model_settings=model_settings or AgentsConfiguration.COGITATOR.model_settings,
         )
-        return strip_think_tags(result.output)
+        return await strip_think_tags_async(result.output)
 
 
 class Probator:
@@ -394,7 +454,7 @@ class Probator:
             user_prompt=f"Original Question: {user_input}\n\nResearch Findings:\n{research}",
             model_settings=model_settings or AgentsConfiguration.PROBATOR.model_settings,
         )
-        output = strip_think_tags(result.output)
+        output = await strip_think_tags_async(result.output)
         if "ADEQUATE" in output.upper():
             return None
         return output
@@ -414,25 +474,40 @@ class ResearchOrchestrator:
         self._explorator: Explorator | None = None
         self._tabularius: Tabularius | None = None
         self._probator: Probator | None = None
+        # warm_up() may run in a worker thread; never build an agent twice
+        self._agent_lock = threading.Lock()
 
     @property
     def explorator(self) -> Explorator:
         if not self._explorator:
-            self._explorator = Explorator()
+            with self._agent_lock:
+                if not self._explorator:
+                    self._explorator = Explorator()
         return self._explorator
 
     @property
     def tabularius(self) -> Tabularius:
         if not self._tabularius:
-            self._tabularius = Tabularius()
+            with self._agent_lock:
+                if not self._tabularius:
+                    self._tabularius = Tabularius()
         return self._tabularius
 
     @property
     def probator(self) -> Probator:
         if not self._probator:
-            self._probator = Probator()
+            with self._agent_lock:
+                if not self._probator:
+                    self._probator = Probator()
         return self._probator
 
+    def warm_up(self) -> None:
+        """Construct the research agents ahead of their first use."""
+        # the lazy properties build each agent on first access
+        self.explorator
+        self.tabularius
+        self.probator
+
     def _select_agents(self, directive: str) -> tuple[bool, bool]:
         """Decide which research agents should handle a directive."""
         use_explorator = self.explorator.should_handle(directive)
@@ -450,9 +525,11 @@ class ResearchOrchestrator:
         if result is None:
             self.logger.warning(f"{label} returned no result")
             return None
-        self.logger.debug(f"[{label}] output:\n{result.output}")
-        tool_data = self._source_builder.build(
-            result.all_messages(), self._get_registry(chat_id)
+        self.logger.debug("[%s] output:\n%s", label, result.output)
+        # Parsing and registering every tool result is CPU-bound; keep it off
+        # the event loop so other chats stay responsive
+        tool_data = await asyncio.to_thread(
+            self._source_builder.build, result.all_messages(), self._get_registry(chat_id)
         )
         training_logger.record_agent(
             deps.interaction_id, label, directive,
@@ -495,13 +572,14 @@ class ResearchOrchestrator:
 
     async def run_research(self, directive: str, deps: AgentDeps) -> str:
         """Dispatch Explorator/Tabularius in parallel and return a summary."""
-        self.logger.debug(f"[Research] directive:\n{directive}")
+        self.logger.debug("[Research] directive:\n%s", directive)
         results = await self._dispatch_agents(directive, deps)
 
         summaries: list[str] = []
         for r in results:
             self._accumulate_findings(deps, f"Research Findings ({r['label']})", r["output"])
             summaries.append(f"[{r['label']}]:\n{r['output']}")
+        summary = "\n\n".join(summaries) if summaries else "No findings returned."
 
         # Update research plan progress if one exists
         plan_status = ""
@@ -512,9 +590,7 @@ class ResearchOrchestrator:
                     or any(tool in directive for tool in obj.tool_names)
                 ):
                     obj.completed = True
-                    obj.findings_summary = (
-                        "\n\n".join(summaries)[:150] if summaries else ""
-                    )
+                    obj.findings_summary = summary[:150] if summaries else ""
             pending = deps.research_plan.pending_objectives()
             if pending:
                 pending_list = "\n".join(
@@ -525,7 +601,6 @@ class ResearchOrchestrator:
                     f"{pending_list}"
                 )
 
-        summary = "\n\n".join(summaries) if summaries else "No findings returned."
         return (
             f"Research complete.\n\n{summary}{plan_status}\n\n"
             "If the above reveals important leads (key people, orgs, breaking events) "
@@ -541,7 +616,7 @@ class ResearchOrchestrator:
             f"CONTEXT: The user originally asked: {deps.user_input}\n"
             f"Search for NEW information — do NOT call get_registered_sources."
         )
-        self.logger.debug(f"[Followup] directive:\n{directive}")
+        self.logger.debug("[Followup] directive:\n%s", directive)
         for r in await self._dispatch_agents(directive, deps, label_suffix="-Followup"):
             self._accumulate_findings(deps, f"Follow-up Findings ({r['label']})", r["output"])
 
@@ -555,11 +630,11 @@ class ResearchOrchestrator:
             )
             if gaps is None:
                 break
-            self.logger.debug(f"[Probator] gaps found:\n{gaps}")
+            self.logger.debug("[Probator] gaps found:\n%s", gaps)
             await deps.update_chat("_Filling research gaps..._")
-            sources_before = len(registry._sources)
+            sources_before = registry.size
             await self.run_followup(gaps, deps)
-            if len(registry._sources) == sources_before:
+            if registry.size == sources_before:
                 self.logger.warning("Followup research added no new sources — stopping gap loop")
                 break
 
@@ -577,19 +652,29 @@ class WritingPipeline:
         self._research = research
         self._nuntius: Nuntius | None = None
         self._cogitator: Cogitator | None = None
+        self._agent_lock = threading.Lock()
 
     @property
     def nuntius(self) -> Nuntius:
         if not self._nuntius:
-            self._nuntius = Nuntius()
+            with self._agent_lock:
+                if not self._nuntius:
+                    self._nuntius = Nuntius()
         return self._nuntius
 
     @property
     def cogitator(self) -> Cogitator:
         if not self._cogitator:
-            self._cogitator = Cogitator()
+            with self._agent_lock:
+                if not self._cogitator:
+                    self._cogitator = Cogitator()
         return self._cogitator
 
+    def warm_up(self) -> None:
+        """Construct the writing agents ahead of their first use."""
+        self.nuntius
+        self.cogitator
+
     async def _build_writing_context(self, deps: AgentDeps, query_embedding: list | None = None) -> str:
         """Build Nuntius input: semantically ranked sources + research summaries."""
         registry = self._get_registry(deps.chat_id)
@@ -597,6 +682,25 @@ class WritingPipeline:
         source_data = registry.format_for_agent_semantic(query_embedding)
         return f"{source_data}\n\n{deps.research_findings}"
 
+    async def _write_candidates(self, deps: AgentDeps, writing_context: str) -> tuple[str, str]:
+        """Write NUNTIUS_CANDIDATES drafts concurrently and review them in parallel.
+
+        Returns the first approved draft and its review, or the first draft
+        and the reviewer's feedback on it if none passed review.
+        """
+        drafts = await asyncio.gather(*(
+            self.nuntius.write(deps.user_input, writing_context)
+            for _ in range(NUNTIUS_CANDIDATES)
+        ))
+        reviews = await asyncio.gather(*(
+            self.cogitator.review(deps.user_input, draft) for draft in drafts
+        ))
+        for draft, feedback in zip(drafts, reviews):
+            training_logger.record_nuntius(deps.interaction_id, draft, feedback)
+            if "APPROVED" in feedback.upper():
+                return draft, feedback
+        return drafts[0], reviews[0]
+
     async def write_and_review(self, deps: AgentDeps) -> str:
         """Write, review, and return the final response text."""
         await deps.update_chat("_Writing response..._")
@@ -606,44 +710,86 @@ class WritingPipeline:
             self.logger.warning(f"Query embedding failed, using recency order: {e}")
             query_embedding = None
         writing_context = await self._build_writing_context(deps, query_embedding)
-        draft = await self.nuntius.write(deps.user_input, writing_context)
-        self.logger.debug(f"[Nuntius] draft:\n{draft}")
-        for _ in range(MAX_REVIEW_CALLS):
-            await deps.update_chat("_Reviewing..._")
-            feedback = await self.cogitator.review(deps.user_input, draft)
-            self.logger.debug(f"[Cogitator] feedback:\n{feedback}")
-            training_logger.record_nuntius(deps.interaction_id, draft, feedback)
+        # Review of the current draft, when one is already in hand
+        feedback: str | None = None
+        if NUNTIUS_CANDIDATES > 1:
+            draft, feedback = await self._write_candidates(deps, writing_context)
+            self.logger.debug("[Nuntius] draft:\n%s", draft)
             if "APPROVED" in feedback.upper():
-                break
-            if (
-                "SEARCH:" in feedback
-                and not deps.review_research_counter.calls_exhausted()
-                    ):
-                self.logger.debug(f"[Cogitator] needs research:\n{feedback}")
-                await deps.update_chat("_Gathering additional information..._")
-                registry = self._get_registry(deps.chat_id)
-                sources_before = len(registry._sources)
-                await self._research.run_followup(feedback, deps)
-                found_new_sources = len(registry._sources) > sources_before
-                if found_new_sources:
-                    await deps.update_chat("_Revising with new information..._")
+                return self._get_registry(deps.chat_id).substitute(strip_think_tags(draft))
+        else:
+            async def report_progress(partial: str) -> None:
+                await deps.update_chat(f"_Writing response... ({len(partial.split())} words so far)_")
+
+            draft = await self.nuntius.write(
+                deps.user_input, writing_context, on_progress=report_progress,
+            )
+            self.logger.debug("[Nuntius] draft:\n%s", draft)
+            if SKIP_REFLECTION or (SKIP_SHORT_REVIEW and looks_final(draft)):
+                self.logger.debug("[Cogitator] review skipped")
+                return self._get_registry(deps.chat_id).substitute(strip_think_tags(draft))
+        for review_round in range(MAX_REVIEW_CALLS):
+            speculative: asyncio.Task | None = None
+            try:
+                if feedback is None:
+                    # Most first-pass reviews reject, so optionally start a fresh
+                    # draft now. It cannot see this review's feedback and is
+                    # dropped if the review approves or asks for research; the
+                    # last round always revises from the feedback instead
+                    if SPECULATIVE_REDRAFT and review_round < MAX_REVIEW_CALLS - 1:
+                        speculative = asyncio.create_task(
+                            self.nuntius.write(deps.user_input, writing_context)
+                        )
+                    # The status update is a Telegram round trip; overlap it with the review call
+                    _, feedback = await asyncio.gather(
+                        deps.update_chat("_Reviewing..._"),
+                        self.cogitator.review(deps.user_input, draft),
+                    )
+                    self.logger.debug("[Cogitator] feedback:\n%s", feedback)
+                    training_logger.record_nuntius(deps.interaction_id, draft, feedback)
+                    if "APPROVED" in feedback.upper():
+                        break
+                if (
+                    "SEARCH:" in feedback
+                    and not deps.review_research_counter.calls_exhausted()
+                        ):
+                    self.logger.debug("[Cogitator] needs research:\n%s", feedback)
+                    await deps.update_chat("_Gathering additional information..._")
+                    registry = self._get_registry(deps.chat_id)
+                    sources_before = registry.size
+                    await self._research.run_followup(feedback, deps)
+                    found_new_sources = registry.size > sources_before
+                    if found_new_sources:
+                        await deps.update_chat("_Revising with new information..._")
+                    else:
+                        self.logger.warning("Review followup added no new sources — revising with existing sources")
+                        await deps.update_chat("_Revising..._")
+                    writing_context = await self._build_writing_context(deps, query_embedding)
+                    nuntius_input = (
+                        writing_context if found_new_sources
+                        else f"{writing_context}\n\nPrevious Draft:\n{draft}\n\nReviewer Feedback:\n{feedback}"
+                    )
+                    draft = await self.nuntius.write(deps.user_input, nuntius_input)
+                elif speculative:
+                    _, draft = await asyncio.gather(deps.update_chat("_Revising..._"), speculative)
                 else:
-                    self.logger.warning("Review followup added no new sources — revising with existing sources")
-                    await deps.update_chat("_Revising..._")
-                writing_context = await self._build_writing_context(deps, query_embedding)
-                nuntius_input = (
-                    writing_context if found_new_sources
-                    else f"{writing_context}\n\nPrevious Draft:\n{draft}\n\nReviewer Feedback:\n{feedback}"
-                )
-                draft = await self.nuntius.write(deps.user_input, nuntius_input)
-            else:
-                await deps.update_chat("_Revising..._")
-                writing_context = await self._build_writing_context(deps, query_embedding)
-                draft = await self.nuntius.write(
-                    deps.user_input,
-                    f"{writing_context}\n\nPrevious Draft:\n{draft}\n\nReviewer Feedback:\n{feedback}",
-                )
-            self.logger.debug(f"[Nuntius] revision:\n{draft}")
+                    # No research ran since the last build, so the registry (and
+                    # therefore the writing context) is unchanged — reuse it.
+                    _, draft = await asyncio.gather(
+                        deps.update_chat("_Revising..._"),
+                        self.nuntius.write(
+                            deps.user_input,
+                            f"{writing_context}\n\nPrevious Draft:\n{draft}\n\nReviewer Feedback:\n{feedback}",
+                        ),
+                    )
+            finally:
+                if speculative is not None:
+                    # Unused (approved, research, or an error): stop it and
+                    # collect its outcome so nothing is left running or unreported
+                    speculative.cancel()
+                    await asyncio.gather(speculative, return_exceptions=True)
+            self.logger.debug("[Nuntius] revision:\n%s", draft)
+            feedback = None
         return self._get_registry(deps.chat_id).substitute(strip_think_tags(draft))
 
 
@@ -654,9 +800,14 @@ class Praetor:
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.history = ChatHistoryManager()
-        self._registries: dict[int, SourceRegistry] = {}
+        self._registries: OrderedDict[int, SourceRegistry] = OrderedDict()
+        # chat_id -> queries in flight; their registries are never evicted
+        self._active_chats: Counter[int] = Counter()
         self._research = ResearchOrchestrator(SourceDataBuilder(), self._get_registry)
         self._writing = WritingPipeline(self._get_registry, self._research)
+        self._warm_up_task: asyncio.Task | None = None
+        self._query_count = 0
+        self._fast_path_count = 0
         from .tools import ALL_RESEARCH_TOOLSET
         self.agent = Agent(
             model=AgentsConfiguration.PRAETOR.make_model(),
@@ -665,6 +816,7 @@ class Praetor:
             output_type=str,
             tools=[
                 self.run_research,
+                self.run_parallel_research,
                 self.get_sources,
                 self.create_research_plan,
                 self.fetch_webpage,
@@ -674,10 +826,28 @@ class Praetor:
         inject_date(self.agent)
         inject_tool_list(self.agent, ALL_RESEARCH_TOOLSET, extra_tools=[self.fetch_webpage])
 
+    def _warm_up_agents(self) -> None:
+        self._research.warm_up()
+        self._writing.warm_up()
+
+    def _on_warm_up_done(self, task: asyncio.Task) -> None:
+        # Agents left unbuilt are constructed lazily on first use; just report why
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.warning("Agent warm-up failed: %s", task.exception(), exc_info=task.exception())
+
     def _get_registry(self, chat_id: int) -> SourceRegistry:
-        if chat_id not in self._registries:
-            self._registries[chat_id] = SourceRegistry()
-        return self._registries[chat_id]
+        registry = self._registries.get(chat_id)
+        if registry is None:
+            registry = self._registries[chat_id] = SourceRegistry()
+            if len(self._registries) > MAX_CHATS:
+                # Oldest idle chat; a query still running needs its sources
+                for old_id in self._registries:
+                    if old_id not in self._active_chats:
+                        del self._registries[old_id]
+                        break
+        else:
+            self._registries.move_to_end(chat_id)
+        return registry
 
     def get_sources_by_tg_command(self, chat_id: int) -> str:
         """Return formatted source list for a chat."""
@@ -700,6 +870,46 @@ class Praetor:
         await ctx.deps.update_chat("_Researching..._")
         return await self._research.run_research(directive, ctx.deps)
 
+    async def run_parallel_research(self, ctx: RunContext[AgentDeps], directives: List[str]) -> str:
+        """Researches several independent directives at the same time.
+
+        Use this instead of repeated run_research calls when the directives
+        don't depend on each other's findings (e.g. two unrelated people or
+        places). Each directive is researched exactly as run_research would.
+        At most 3 directives are researched per call.
+
+        Args:
+            directives (List[str]): Independent research directives.
+
+        Returns:
+            str: Research findings for each directive, in the order given.
+        """
+        await ctx.deps.update_chat("_Researching..._")
+        skipped = directives[MAX_PARALLEL_DIRECTIVES:]
+        directives = directives[:MAX_PARALLEL_DIRECTIVES]
+        results = await asyncio.gather(
+            *(self._research.run_research(d, ctx.deps) for d in directives),
+            return_exceptions=True,
+        )
+        sections: list[str] = []
+        for directive, result in zip(directives, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                self.logger.warning("Parallel research failed for directive: %s", result)
+                result = "Research failed for this directive."
+            sections.append(f"Directive: {directive}\n{result}")
+        if skipped:
+            self.logger.warning(
+                "Parallel research capped at %d directives; skipped %d",
+                MAX_PARALLEL_DIRECTIVES, len(skipped),
+            )
+            sections.append(
+                "Not researched (limit reached), call again if still needed:\n"
+                + "\n".join(f"- {d}" for d in skipped)
+            )
+        return "\n\n---\n\n".join(sections)
+
     async def get_sources(self, ctx: RunContext[AgentDeps]) -> str:
         """Returns sources already collected in this conversation.
 
@@ -741,8 +951,9 @@ class Praetor:
                 line = line[line.index(")") + 1:].strip()
             plan.objectives.append(ResearchObjective(description=line, tool_names=tools))
         ctx.deps.research_plan = plan
-        logger.debug(f"[Praetor] Research plan created:\n{plan.summary()}")
-        return plan.summary()
+        summary = plan.summary()
+        logger.debug("[Praetor] Research plan created:\n%s", summary)
+        return summary
 
     async def fetch_webpage(self, ctx: RunContext[AgentDeps], url: str) -> str:
         """Fetch a user-provided webpage directly for context and citation."""
@@ -761,12 +972,61 @@ class Praetor:
             f"Body:\n{page.body}"
         )
 
+    def _use_fast_path(self, user_input: str, chat_id: int) -> bool:
+        """Short opening questions rarely need Praetor to rephrase them as a directive.
+
+        Follow-ups always go through Praetor since they depend on chat history.
+        """
+        return (
+            0 < len(user_input.split()) <= FAST_PATH_MAX_WORDS
+            and not self.history.get(chat_id)
+        )
+
+    async def _handle_fast_path(self, deps: AgentDeps) -> str | None:
+        """Research the user input directly, skipping the coordinator call.
+
+        Returns the final response, or None if research found nothing and the
+        query should fall back to Praetor.
+        """
+        await deps.update_chat("_Researching..._")
+        await self._research.run_research(deps.user_input, deps)
+        if not deps.research_findings:
+            return None
+        training_logger.set_path(deps.interaction_id, "osint")
+        await self._research.run_gap_analysis(deps)
+        final = await self._writing.write_and_review(deps)
+        self.history.update(deps.chat_id, [
+            ModelRequest(parts=[UserPromptPart(content=deps.user_input)]),
+            ModelResponse(parts=[TextPart(content=final)]),
+        ])
+        return final
+
     async def handle_query(
                 self,
                 user_input: str,
                 chat_id: int,
                 update_chat: Callable[[str], Awaitable[None]]
             ) -> tuple[str, str]:
+        self._active_chats[chat_id] += 1
+        try:
+            return await self._run_query(user_input, chat_id, update_chat)
+        finally:
+            self._active_chats[chat_id] -= 1
+            if self._active_chats[chat_id] <= 0:
+                del self._active_chats[chat_id]
+
+    async def _run_query(
+                self,
+                user_input: str,
+                chat_id: int,
+                update_chat: Callable[[str], Awaitable[None]]
+            ) -> tuple[str, str]:
+        if self._warm_up_task is None:
+            # Build sub-agents in a worker thread while Praetor's first LLM call runs
+            self._warm_up_task = asyncio.create_task(
+                asyncio.to_thread(self._warm_up_agents)
+            )
+            self._warm_up_task.add_done_callback(self._on_warm_up_done)
         await update_chat("_Thinking..._")
         iid = training_logger.start(chat_id, user_input)
         deps = AgentDeps(
@@ -776,16 +1036,32 @@ class Praetor:
             source_registry=self._get_registry(chat_id),
             interaction_id=iid,
         )
+        try_fast_path = False
+        if FAST_PATH_MAX_WORDS:
+            self._query_count += 1
+            try_fast_path = self._use_fast_path(user_input, chat_id)
         final = ""
         for attempt in range(MAX_SPECIAL_RETRIES + 1):
             try:
+                if try_fast_path:
+                    # Only the first attempt; retries go through Praetor
+                    try_fast_path = False
+                    fast_final = await self._handle_fast_path(deps)
+                    if fast_final is not None:
+                        self._fast_path_count += 1
+                        self.logger.info(
+                            "Fast path: %d/%d queries skipped Praetor",
+                            self._fast_path_count, self._query_count,
+                        )
+                        await update_chat(fast_final)
+                        return iid, training_logger.finalize(iid, [], fast_final)
                 result = await self.agent.run(
                     user_prompt=user_input,
                     message_history=self.history.get(chat_id),
                     deps=deps,
                     model_settings=AgentsConfiguration.PRAETOR.model_settings,
                 )
-                logger.debug(f"[Praetor] output:\n{result.output}")
+                logger.debug("[Praetor] output:\n%s", result.output)
                 self.history.update(chat_id, result.all_messages())
                 if deps.research_findings:
                     training_logger.set_path(iid, "osint")
@@ -793,7 +1069,7 @@ class Praetor:
                     final = await self._writing.write_and_review(deps)
                     await update_chat(final)
                 elif result.output:
-                    final = self._get_registry(chat_id).substitute(strip_think_tags(result.output))
+                    final = self._get_registry(chat_id).substitute(await strip_think_tags_async(result.output))
                     await update_chat(final)
                 path = training_logger.finalize(iid, result.all_messages(), final)
                 return iid, path
@@ -1,5 +1,6 @@
 import logging
-from typing import Dict, List
+from collections import OrderedDict
+from typing import List
 
 from pydantic_ai.messages import (
     ModelMessage,
@@ -9,7 +10,7 @@ from pydantic_ai.messages import (
     TextPart,
 )
 
-from .settings import MAX_HISTORY
+from .settings import MAX_HISTORY, MAX_CHATS
 
 
 class ChatHistoryManager:
@@ -26,16 +27,24 @@ class ChatHistoryManager:
     MAX_HISTORY = MAX_HISTORY
 
     def __init__(self):
-        self._histories: Dict[int, List[ModelMessage]] = {}
+        # Least recently used (read or updated) chats are evicted past MAX_CHATS
+        self._histories: OrderedDict[int, List[ModelMessage]] = OrderedDict()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def get(self, chat_id: int) -> List[ModelMessage]:
         """Return stored message history for a chat."""
-        return self._histories.get(chat_id, [])
+        history = self._histories.get(chat_id)
+        if history is None:
+            return []
+        self._histories.move_to_end(chat_id)
+        return history
 
     def update(self, chat_id: int, messages: List[ModelMessage]) -> None:
         """Compress and store history after a completed pipeline run."""
         self._histories[chat_id] = self._compress(messages)
+        self._histories.move_to_end(chat_id)
+        if len(self._histories) > MAX_CHATS:
+            self._histories.popitem(last=False)
 
     def clear(self, chat_id: int) -> None:
         """Discard all history for a chat."""
@@ -43,20 +52,16 @@ class ChatHistoryManager:
 
     def _split_into_turns(self, messages: List[ModelMessage]) -> List[List[ModelMessage]]:
         """Group messages into pipeline runs, each starting with a UserPromptPart."""
-        # XXX: There must be a way to refactor this
-        # *Bangs on table* "There must be a better way"
-        #               - Raymond Hettinger
         turns, current = [], []
         for msg in messages:
-            if isinstance(msg, ModelRequest):
-                if any(
-                    isinstance(
-                        message_part, UserPromptPart
-                        ) for message_part in msg.parts
-                        ):
-                    if current:
-                        turns.append(current)
-                    current = []
+            # Exact type checks: pydantic-ai message classes are concrete dataclasses
+            if type(msg) is ModelRequest:
+                for part in msg.parts:
+                    if type(part) is UserPromptPart:
+                        if current:
+                            turns.append(current)
+                        current = []
+                        break
             current.append(msg)
         if current:
             turns.append(current)
@@ -68,9 +73,11 @@ class ChatHistoryManager:
         Praetor produces plain text output — find the last non-empty TextPart.
         """
         for msg in reversed(turn):
-            if isinstance(msg, ModelResponse):
-                for part in reversed(list(msg.parts)):
-                    if isinstance(part, TextPart) and part.content.strip():
+            if type(msg) is ModelResponse:
+                parts = msg.parts
+                for i in range(len(parts) - 1, -1, -1):
+                    part = parts[i]
+                    if type(part) is TextPart and part.content.strip():
                         return part.content
 
         return None
@@ -80,24 +87,57 @@ class ChatHistoryManager:
 
         Falls back to keeping the full turn if no answer can be extracted.
         """
+        if (
+            len(turn) == 2
+            and type(turn[1]) is ModelResponse
+            and len(turn[1].parts) == 1
+            and type(turn[1].parts[0]) is TextPart
+            and turn[1].parts[0].content.strip()
+        ):
+            return turn  # already compressed on a previous update
         answer = self._extract_answer(turn)
         if answer is None:
             self.logger.warning("Could not extract answer from turn — dropping turn")
             return []
-        self.logger.info(f"Compressed turn: {len(turn)} msgs → 2")
+        self.logger.info("Compressed turn: %d msgs → 2", len(turn))
         return [turn[0], ModelResponse(parts=[TextPart(content=answer)])]
 
+    def _trim(self, messages: List[ModelMessage]) -> List[ModelMessage]:
+        """Keep the newest MAX_HISTORY messages without starting on a model response.
+
+        History is trimmed when stored, so every Praetor call is sent an
+        already-bounded prompt rather than trimming after the fact.
+        """
+        start = max(len(messages) - self.MAX_HISTORY, 0)
+        while start < len(messages) and not isinstance(messages[start], ModelRequest):
+            start += 1
+        return messages[start:]
+
+    def _tail(self, messages: List[ModelMessage]) -> List[ModelMessage]:
+        """Drop turns that can't survive the final trim before compressing.
+
+        Keeps MAX_HISTORY * 5 messages of headroom for the uncompressed
+        latest turn, then advances to the next turn boundary so no turn is
+        split. Falls back to all messages if the slice holds no boundary.
+        """
+        cap = self.MAX_HISTORY * 5
+        if len(messages) <= cap:
+            return messages
+        for i in range(len(messages) - cap, len(messages)):
+            msg = messages[i]
+            if type(msg) is ModelRequest and any(type(p) is UserPromptPart for p in msg.parts):
+                return messages[i:]
+        return messages
+
     def _compress(self, messages: List[ModelMessage]) -> List[ModelMessage]:
         """Compress all but the most recent turn, then apply safety trim."""
         if not messages:
             return messages
-        turns = self._split_into_turns(messages)
+        turns = self._split_into_turns(self._tail(messages))
         if len(turns) <= 1:
-            return messages[-self.MAX_HISTORY:]
+            return self._trim(messages)
         compressed = []
         for turn in turns[:-1]:
             compressed.extend(self._compress_turn(turn))
         compressed.extend(turns[-1])
-        if len(compressed) > self.MAX_HISTORY:
-            compressed = compressed[-self.MAX_HISTORY:]
-        return compressed
+        return self._trim(compressed)
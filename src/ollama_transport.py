@@ -1,9 +1,26 @@
-import json
+import re
+import asyncio
 import logging
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# A "content" key set to null. The key must follow "{" or ",": in valid JSON a
+# bare quote after those can only open a key, never sit inside a string value,
+# so text that merely mentions "content":null is left alone.
+_NULL_CONTENT_RE = re.compile(rb'([{,]\s*"content"\s*:\s*)null')
+
+# All agents (and embedding lookups) share one pool to the same Ollama host,
+# so keep plenty of warm keep-alive connections for parallel agent calls.
+POOL_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=300,
+)
+# Connection-level retries only (refused/reset connects, e.g. while Ollama restarts);
+# httpx never replays a request that reached the server.
+CONNECT_RETRIES = 2
+
 
 class OllamaRetryTransport(httpx.AsyncBaseTransport):
     """Sanitizes and retries requests to Ollama's OpenAI-compatible API.
@@ -21,39 +38,35 @@ class OllamaRetryTransport(httpx.AsyncBaseTransport):
     """
 
     MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.05  # seconds, doubled per attempt
 
     def __init__(self):
-        self._transport = httpx.AsyncHTTPTransport()
+        self._transport = httpx.AsyncHTTPTransport(limits=POOL_LIMITS, retries=CONNECT_RETRIES)
 
     def _sanitize_request(self, request: httpx.Request) -> httpx.Request:
-        """Replace null message content with empty string for Ollama compatibility."""
-        try:
-            body = json.loads(request.content)
-            if 'messages' not in body:
-                return request
-
-            changed = False
-            for msg in body['messages']:
-                if msg.get('content') is None:
-                    msg['content'] = ''
-                    changed = True
+        """Replace null message content with empty string for Ollama compatibility.
 
-            if not changed:
+        Patched at the byte level (see _NULL_CONTENT_RE) so every other byte
+        of the body is kept as-is without a parse/serialize round trip.
+        """
+        try:
+            content = request.content
+            patched = _NULL_CONTENT_RE.sub(rb'\1""', content)
+            if patched == content:
                 return request
-
-            return self.fix_request(request, body)
+            return self._with_content(request, patched)
         except Exception:
             return request
 
-    def fix_request(self, request: httpx.Request, body: dict) -> httpx.Request:
-        fixed = json.dumps(body, separators=(',', ':')).encode()
+    @staticmethod
+    def _with_content(request: httpx.Request, content: bytes) -> httpx.Request:
         headers = dict(request.headers)
-        headers['content-length'] = str(len(fixed))
+        headers['content-length'] = str(len(content))
         return httpx.Request(
             method=request.method,
             url=request.url,
             headers=headers,
-            content=fixed,
+            content=content,
         )
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
@@ -62,14 +75,34 @@ class OllamaRetryTransport(httpx.AsyncBaseTransport):
             response = await self._transport.handle_async_request(request)
             if response.status_code != 500 or attempt == self.MAX_RETRIES:
                 return response
-            await response.aread()  # drain body so connection can be reused
+            # Read (not just close) the small error body: closing an unread
+            # HTTP/1.1 response drops the connection instead of pooling it
+            await response.aread()
+            await response.aclose()
             logger.warning(
                 f"Ollama 500 (attempt {attempt}/{self.MAX_RETRIES}), retrying..."
             )
+            await asyncio.sleep(self.RETRY_BACKOFF * 2 ** (attempt - 1))
         return response
 
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
 
 ollama_http_client = httpx.AsyncClient(
     transport=OllamaRetryTransport(),
     timeout=httpx.Timeout(180.0, connect=10.0),
 )
+
+
+async def warm_up_ollama(api_root: str) -> None:
+    """Open a pooled connection to Ollama before the first user query.
+
+    Agent calls run in parallel, so the server should also be started with
+    OLLAMA_NUM_PARALLEL >= 2 (and OLLAMA_MAX_LOADED_MODELS covering every
+    configured model) or Ollama will queue them internally.
+    """
+    try:
+        await ollama_http_client.get(f"{api_root.rstrip('/')}/api/tags", timeout=10.0)
+    except Exception as e:  # best effort; never let a warm-up failure reach startup
+        logger.warning(f"Ollama warm-up failed: {e}")
@@ -1,8 +1,9 @@
 import os
-import json
+from functools import cached_property
 from pathlib import Path
 from dotenv import load_dotenv
 
+import orjson
 import yarl
 from dateutil.tz import gettz
 
@@ -26,15 +27,24 @@ TZ_INFOS = {
 }
 
 
-class RSS:
+class _RSSFeeds:
     FEED_DIR = Path("rss_feeds/")
     FEED_DIR.mkdir(exist_ok=True)
 
     US_GOV = FEED_DIR.joinpath("gov_feeds.json")
     WORLD_NEWS = FEED_DIR.joinpath("world_news_feeds.json")
 
-    US_GOV_JSON = json.loads(US_GOV.read_text())
-    WORLD_NEWS_JSON = json.loads(WORLD_NEWS.read_text())
+    # Feed lists are parsed on first use rather than at import
+    @cached_property
+    def US_GOV_JSON(self):
+        return orjson.loads(self.US_GOV.read_bytes())
+
+    @cached_property
+    def WORLD_NEWS_JSON(self):
+        return orjson.loads(self.WORLD_NEWS.read_bytes())
+
+
+RSS = _RSSFeeds()
 
 
 class OllamaEndpoints:
@@ -77,7 +87,22 @@ class CourtListenerCredentials:
 
 
 MAX_HISTORY = int(os.getenv("MAX_HISTORY", 30))
+# Chats whose history/sources are kept in memory; least recently used are evicted
+MAX_CHATS = int(os.getenv("MAX_CHATS", 1024))
 OLLAMA_NUM_CTX = int(os.getenv("OLLAMA_CTX_SIZE", 8192))
+# Initial drafts written concurrently; >1 needs OLLAMA_NUM_PARALLEL on the server
+NUNTIUS_CANDIDATES = int(os.getenv("NUNTIUS_CANDIDATES", 1))
+# Skip the Cogitator review loop entirely (for A/B latency testing)
+SKIP_REFLECTION = os.getenv("SKIP_REFLECTION", "").lower() in ("1", "true", "yes")
+# Skip review for short drafts that don't hedge (see ai.looks_final)
+SKIP_SHORT_REVIEW = os.getenv("SKIP_SHORT_REVIEW", "").lower() in ("1", "true", "yes")
+# Draft a replacement alongside each review and use it if the review rejects
+# (trades extra writer tokens for one hidden round trip)
+SPECULATIVE_REDRAFT = os.getenv("SPECULATIVE_REDRAFT", "").lower() in ("1", "true", "yes")
+# Fresh queries up to this many words skip Praetor and go straight to research (0 = off)
+FAST_PATH_MAX_WORDS = int(os.getenv("FAST_PATH_MAX_WORDS", 0))
+# Seconds between Nuntius progress updates while a draft streams (0 = no streaming)
+NUNTIUS_STREAM_INTERVAL = float(os.getenv("NUNTIUS_STREAM_INTERVAL", 0))
 
 LOG_DIR = Path(os.getenv("LOG_DIRECTORY", "logs"))
 LOG_DIR.mkdir(exist_ok=True)
\ No newline at end of file
@@ -1,16 +1,32 @@
 import re
 import asyncio
+import functools
 import logging
-import httpx
+import threading
 from dataclasses import dataclass, field
 from typing import (
         Protocol,
         runtime_checkable,
         List,
         Any,
+        Iterable,
+        Iterator,
         Optional
     )
 
+from pydantic_ai.messages import ModelRequest, ToolReturnPart
+
+
+# Tag normalization patterns used by SourceRegistry.substitute
+_INNER_TAG_RE = re.compile(r'SOURCE_\w+', re.IGNORECASE)
+_COMPOUND_TAG_RE = re.compile(r'\[(SOURCE_\w+(?:\s*,\s*SOURCE_\w+)+)\]', re.IGNORECASE)
+_BARE_TAG_RE = re.compile(r'(?<!\[)(SOURCE_\w+)(?!\])', re.IGNORECASE)
+_SPACED_TAG_RE = re.compile(r'\[SOURCE\s+(\w+)\]', re.IGNORECASE)
+_UNCLOSED_TAG_RE = re.compile(r'\[source_(\w+)\b(?!\])', re.IGNORECASE)
+_CASED_TAG_RE = re.compile(r'\[source_(\w+)\]', re.IGNORECASE)
+_LEFTOVER_TAG_RE = re.compile(r'\[SOURCE_\w+\]', re.IGNORECASE)
+_PAREN_SOURCES_RE = re.compile(r'\s*\(Sources?\s+[\d,\s–\-]+\)')
+
 
 PRIMARY_DOMAINS = {
     '.gov', '.mil', '.edu',
@@ -32,19 +48,25 @@ def _cosine_similarity(a: list, b: list) -> float:
     return dot / (norm_a * norm_b) if norm_a and norm_b else 0.0
 
 
+@functools.cache
+def _embeddings_url() -> str:
+    from .settings import OllamaEndpoints
+    return str(OllamaEndpoints.EMBEDDINGS)
+
+
 async def get_query_embedding(text: str) -> list:
     """Fetch an embedding vector from Ollama mxbai-embed-large."""
-    from .settings import OllamaEndpoints
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.post(
-            str(OllamaEndpoints.EMBEDDINGS),
-            json={"model": "mxbai-embed-large", "prompt": text},
-        )
-        resp.raise_for_status()
-        return resp.json()["embedding"]
+    from .ollama_transport import ollama_http_client
+    resp = await ollama_http_client.post(
+        _embeddings_url(),
+        json={"model": "mxbai-embed-large", "prompt": text},
+        timeout=30.0,
+    )
+    resp.raise_for_status()
+    return resp.json()["embedding"]
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceItem:
     """A registered source with URL and title."""
     url: str
@@ -55,6 +77,11 @@ class SourceItem:
     is_primary: bool = False
     embed_text: str = ""
     embedding: list = field(default=None, repr=False)  # list[float] | None
+    rendered: str = field(default="", repr=False)  # markdown link, set once
+
+    def __post_init__(self):
+        if not self.rendered:
+            self.rendered = f"[{self.title}]({self.url})"
 
     @property
     def confidence_level(self) -> str:
@@ -72,6 +99,47 @@ class Sourceable(Protocol):
     def source_url(self) -> str: ...
 
 
+# Attribute fallbacks for source_name and description, first truthy value wins
+_NAME_ATTRS = ('source', 'source_name', 'author_handle')
+_DESC_ATTRS = ('body', 'summary', 'text')
+
+# type -> True when the class itself declares source_url (a property on every
+# model here), so its instances skip the per-item Protocol check
+_SOURCEABLE_TYPES: dict[type, bool] = {}
+
+
+def _is_sourceable(item: Any) -> bool:
+    cls = type(item)
+    declared = _SOURCEABLE_TYPES.get(cls)
+    if declared is None:
+        declared = _SOURCEABLE_TYPES[cls] = hasattr(cls, 'source_url')
+    # Fall back to the instance check for types that set source_url per instance
+    return declared or isinstance(item, Sourceable)
+
+
+def _first_truthy(item: Any, attrs: tuple[str, ...]) -> Any:
+    for attr in attrs:
+        value = getattr(item, attr, '')
+        if value:
+            return value
+    return ''
+
+
+def _sourceable_fields(item: Any) -> Optional[tuple[str, str, str, str]]:
+    """Return (url, title, source_name, description[:200]) for a Sourceable item.
+
+    Every attribute is optional and read with a default, so an instance
+    missing one degrades to ''. Returns None if the item is not Sourceable.
+    """
+    if not _is_sourceable(item):
+        return None
+    title = getattr(item, 'title', '') or ''
+    source_name = _first_truthy(item, _NAME_ATTRS)
+    # Only the chosen description is sliced; long bodies are never copied whole
+    description = _first_truthy(item, _DESC_ATTRS)[:200]
+    return item.source_url, title, source_name, description
+
+
 class SourceRegistry:
     """Registry that maps [SOURCE_N] placeholders to real URLs.
 
@@ -93,9 +161,19 @@ class SourceRegistry:
             yield n
 
     def __init__(self):
-        self._sources: dict[str, SourceItem] = {}  # tag -> SourceItem (insertion-ordered)
+        # tag -> SourceItem; plain dicts keep insertion order (3.7+), so the
+        # first key is always the oldest registration
+        self._sources: dict[str, SourceItem] = {}
         self._url_to_tag: dict[str, str] = {}      # url -> tag (for deduplication)
         self._counter = self._make_counter()
+        # Bumped on every insert/evict; substitute() rebuilds its pattern
+        # only when the version it was compiled for is stale
+        self._version = 0
+        self._sub_cache: Optional[tuple[re.Pattern, dict[str, str]]] = None
+        self._compiled_for_version = -1
+        # SourceDataBuilder.build may register from a worker thread while
+        # tools register on the event loop
+        self._lock = threading.Lock()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     @property
@@ -119,39 +197,41 @@ class SourceRegistry:
 
         url = url.strip()
 
-        # Deduplicate: return existing tag if URL already registered
-        if url in self._url_to_tag:
-            existing_tag = self._url_to_tag[url]
-            self._sources[existing_tag].corroboration_count += 1
-            return existing_tag
-
-        # Evict oldest entry if at capacity
-        if len(self._sources) >= self.MAX_SIZE:
-            oldest_tag, oldest_item = next(iter(self._sources.items()))
-            del self._sources[oldest_tag]
-            del self._url_to_tag[oldest_item.url]
-            self.logger.debug(f"Registry full ({self.MAX_SIZE}): evicted {oldest_tag}")
-
-        tag = f"[SOURCE_{self.counter}]"
-
-        embed_text = description[:200] if description else (title or url)
-
-        item = SourceItem(url=url, title=title if title else "Source",
-                          source_name=source_name, description=description,
-                          is_primary=_classify_primary(url),
-                          embed_text=embed_text)
-        self._sources[tag] = item
-        self._url_to_tag[url] = tag
-
-        return tag
+        with self._lock:
+            # Deduplicate: return existing tag if URL already registered
+            if url in self._url_to_tag:
+                existing_tag = self._url_to_tag[url]
+                self._sources[existing_tag].corroboration_count += 1
+                return existing_tag
+
+            # Evict oldest entry if at capacity
+            if len(self._sources) >= self.MAX_SIZE:
+                oldest_tag = next(iter(self._sources))
+                oldest_item = self._sources.pop(oldest_tag)
+                del self._url_to_tag[oldest_item.url]
+                self.logger.debug("Registry full (%d): evicted %s", self.MAX_SIZE, oldest_tag)
+                self._version += 1
+
+            tag = f"[SOURCE_{self.counter}]"
+
+            embed_text = description[:200] if description else (title or url)
+
+            item = SourceItem(url=url, title=title if title else "Source",
+                              source_name=source_name, description=description,
+                              is_primary=_classify_primary(url),
+                              embed_text=embed_text)
+            self._sources[tag] = item
+            self._url_to_tag[url] = tag
+            self._version += 1
+            return tag
 
     @staticmethod
     def _expand_compound_tags(text: str) -> str:
         """Expand [SOURCE_X, SOURCE_Y] into [SOURCE_X] [SOURCE_Y]."""
         def expand(match: re.Match) -> str:
-            tags = re.findall(r'SOURCE_\w+', match.group(1), re.IGNORECASE)
+            tags = _INNER_TAG_RE.findall(match.group(1))
             return ' '.join(f'[{t.upper()}]' for t in tags)
-        return re.sub(r'\[(SOURCE_\w+(?:\s*,\s*SOURCE_\w+)+)\]', expand, text, flags=re.IGNORECASE)
+        return _COMPOUND_TAG_RE.sub(expand, text)
 
     @staticmethod
     def _normalize_bare_tags(text: str) -> str:
@@ -164,7 +244,29 @@ class SourceRegistry:
         # Match SOURCE_\w+ not already surrounded by [ ]
         def _upper_bracket(m: re.Match) -> str:
             return f'[{m.group(1).upper()}]'
-        return re.sub(r'(?<!\[)(SOURCE_\w+)(?!\])', _upper_bracket, text, flags=re.IGNORECASE)
+        return _BARE_TAG_RE.sub(_upper_bracket, text)
+
+    def _substitution_pattern(self) -> tuple[re.Pattern, dict[str, str]]:
+        """Return the alternation over all tags and (source_name) patterns.
+
+        For a name shared by several sources the oldest registered source
+        is used.
+        """
+        if self._compiled_for_version == self._version:
+            return self._sub_cache
+        with self._lock:
+            if self._compiled_for_version != self._version:
+                # Tags are bracketed and names parenthesised, so keys never collide
+                replacements: dict[str, str] = {}
+                for tag, item in self._sources.items():
+                    replacements[tag] = item.rendered
+                    if item.source_name:
+                        replacements.setdefault(f"({item.source_name})", item.rendered)
+                # Longest first so no key can shadow one it is a prefix of
+                keys = sorted(replacements, key=len, reverse=True)
+                self._sub_cache = (re.compile('|'.join(map(re.escape, keys))), replacements)
+                self._compiled_for_version = self._version
+            return self._sub_cache
 
     def substitute(self, text: str) -> str:
         """Replace all [SOURCE_N] placeholders with markdown links.
@@ -182,66 +284,84 @@ class SourceRegistry:
         if not text:
             return text
 
-        # Normalize compound tags like [SOURCE_1, SOURCE_3] → [SOURCE_1] [SOURCE_3]
-        text = self._expand_compound_tags(text)
+        # Every tag form and the (Source N) references contain "source";
+        # without it only the (source_name) fallback can apply
+        cites_tags = 'source' in text.lower()
+        if not cites_tags and '(' not in text:
+            return text
 
-        # Normalize space separator: [SOURCE 3] → [SOURCE_3]
-        text = re.sub(r'\[SOURCE\s+(\w+)\]', lambda m: f'[SOURCE_{m.group(1)}]', text, flags=re.IGNORECASE)
+        if cites_tags:
+            # Normalize compound tags like [SOURCE_1, SOURCE_3] → [SOURCE_1] [SOURCE_3]
+            text = self._expand_compound_tags(text)
 
-        # Fix unclosed brackets: [SOURCE_3 → [SOURCE_3]
-        text = re.sub(r'\[source_(\w+)\b(?!\])', lambda m: f'[SOURCE_{m.group(1).upper()}]', text, flags=re.IGNORECASE)
+            # Normalize space separator: [SOURCE 3] → [SOURCE_3]
+            text = _SPACED_TAG_RE.sub(lambda m: f'[SOURCE_{m.group(1)}]', text)
 
-        # Normalize bare references like SOURCE_3 or *SOURCE_3* → [SOURCE_3]
-        text = self._normalize_bare_tags(text)
+            # Fix unclosed brackets: [SOURCE_3 → [SOURCE_3]
+            text = _UNCLOSED_TAG_RE.sub(lambda m: f'[SOURCE_{m.group(1).upper()}]', text)
 
-        # Normalize case: [Source_3], [source_3] → [SOURCE_3]
-        text = re.sub(r'\[source_(\w+)\]', lambda m: f'[SOURCE_{m.group(1)}]', text, flags=re.IGNORECASE)
+            # Normalize bare references like SOURCE_3 or *SOURCE_3* → [SOURCE_3]
+            text = self._normalize_bare_tags(text)
 
-        # Primary: replace registered [SOURCE_N] tags with markdown links
-        for tag, item in self._sources.items():
-            if tag in text:
-                self.logger.debug(f"Substituting {tag} with URL: {item.url}")
-            text = text.replace(tag, f"[{item.title}]({item.url})")
+            # Normalize case: [Source_3], [source_3] → [SOURCE_3]
+            text = _CASED_TAG_RE.sub(lambda m: f'[SOURCE_{m.group(1)}]', text)
 
-        # Fallback: replace (source_name) patterns the model wrote instead of tags
-        seen: set[str] = set()
-        for item in self._sources.values():
-            name = item.source_name
-            if not name or name in seen:
-                continue
-            seen.add(name)
-            pattern = f"({name})"
-            if pattern in text:
-                text = text.replace(pattern, f"[{item.title}]({item.url})")
+        # Replace registered [SOURCE_N] tags and the (source_name) fallbacks
+        # the model wrote instead of tags in a single scan of the text
+        if self._sources:
+            pattern, replacements = self._substitution_pattern()
+
+            def _link(m: re.Match) -> str:
+                key = m.group(0)
+                self.logger.debug("Substituting %s with %s", key, replacements[key])
+                return replacements[key]
 
-        # Strip any remaining [SOURCE_N] tags not in registry (hallucinated or evicted)
-        text = re.sub(r'\[SOURCE_\w+\]', '', text, flags=re.IGNORECASE)
+            text = pattern.sub(_link, text)
 
-        # Strip parenthetical source references the model wrote instead of tags
-        # e.g. (Source 51), (Sources 47, 49, 50), (Sources 57–64)
-        text = re.sub(r'\s*\(Sources?\s+[\d,\s–\-]+\)', '', text)
+        if cites_tags:
+            # Strip any remaining [SOURCE_N] tags not in registry (hallucinated or evicted).
+            # Normalization upper-cased every tag, so the probe can be exact
+            if '[SOURCE_' in text:
+                text = _LEFTOVER_TAG_RE.sub('', text)
+
+            # Strip parenthetical source references the model wrote instead of tags
+            # e.g. (Source 51), (Sources 47, 49, 50), (Sources 57–64)
+            if '(Source' in text:
+                text = _PAREN_SOURCES_RE.sub('', text)
 
         return text
 
+    def _snapshot(self) -> list[tuple[str, SourceItem]]:
+        """Copy of the (tag, item) pairs, safe to iterate while build() registers."""
+        with self._lock:
+            return list(self._sources.items())
+
     def format_for_user(self) -> str:
         """Format sources for Telegram user display."""
-        if not self._sources:
+        items = self._snapshot()
+        if not items:
             return "No sources collected yet."
-        lines = [f"**{len(self._sources)} sources collected:**\n"]
-        for tag, item in self._sources.items():
-            lines.append(f"- [{item.title}]({item.url}) [{item.confidence_level}]")
+        lines = [f"**{len(items)} sources collected:**\n"]
+        for tag, item in items:
+            lines.append(f"- {item.rendered} [{item.confidence_level}]")
         return "\n".join(lines)
 
     @property
     def source_map(self) -> dict[str, str]:
         """Returns a copy of the tag->URL mapping."""
-        return {tag: item.url for tag, item in self._sources.items()}
+        return {tag: item.url for tag, item in self._snapshot()}
 
     @property
     def count(self) -> int:
         """Returns the number of registered sources."""
         return self._counter
 
+    @property
+    def size(self) -> int:
+        """Number of sources currently held (after eviction)."""
+        with self._lock:
+            return len(self._sources)
+
     FORMAT_LIMIT = 25
     FORMAT_DESC_LEN = 80
 
@@ -263,21 +383,12 @@ class SourceRegistry:
         names automatically. Returns empty string if item is not Sourceable or
         has no source_url.
         """
-        if not isinstance(item, Sourceable) or not item.source_url:
+        fields = _sourceable_fields(item)
+        if fields is None or not fields[0]:
             return ""
-        title = getattr(item, 'title', '') or ''
-        source_name = (
-            getattr(item, 'source', '') or
-            getattr(item, 'source_name', '') or
-            getattr(item, 'author_handle', '') or ''
-        )
-        description = (
-            getattr(item, 'body', '') or
-            getattr(item, 'summary', '') or
-            getattr(item, 'text', '') or ''
-        )[:200]
+        url, title, source_name, description = fields
         return registry.register(
-            url=item.source_url,
+            url=url,
             title=title,
             source_name=source_name,
             description=description,
@@ -304,7 +415,7 @@ class SourceRegistry:
 
     async def embed_sources(self) -> None:
         """Compute and store embeddings for all sources not yet embedded."""
-        pending = [item for item in self._sources.values() if item.embedding is None]
+        pending = [item for _, item in self._snapshot() if item.embedding is None]
         if not pending:
             return
 
@@ -322,11 +433,10 @@ class SourceRegistry:
         If query_embedding is None or no embeddings have been computed, falls back
         to recency order. Sources with embeddings are always ranked before unembedded ones.
         """
-        if not self._sources:
+        items = self._snapshot()
+        if not items:
             return "No sources have been collected yet."
 
-        items = list(self._sources.items())
-
         if query_embedding is not None:
             scored, unscored = [], []
             for tag, item in items:
@@ -355,9 +465,9 @@ class SourceDataBuilder:
     """Builds formatted source data from tool results with URL registry."""
 
     # Tools whose output is instructions to the researcher, not source data
-    INTERMEDIATE_TOOLS = {
+    INTERMEDIATE_TOOLS = frozenset({
         "search_wikipedia",   # context only — not a citable reference
-    }
+    })
 
     def build(self, messages: List[Any], registry: SourceRegistry) -> str:
         """Extract tool results from messages and register sources.
@@ -379,7 +489,7 @@ class SourceDataBuilder:
 
     def _collect_sections(
         self,
-        tool_parts: List[Any],
+        tool_parts: Iterable[Any],
         registry: SourceRegistry,
         filter_text: Optional[str],
     ) -> List[str]:
@@ -391,19 +501,18 @@ class SourceDataBuilder:
                 sections.append(section)
         return sections
 
-    def _extract_tool_parts(self, messages: List[Any]) -> List[Any]:
-        """Extract non-intermediate tool parts from messages."""
-        from pydantic_ai.messages import ModelRequest, ToolReturnPart
-
-        parts = []
+    def _extract_tool_parts(self, messages: Iterable[Any]) -> Iterator[Any]:
+        """Yield non-intermediate tool parts from messages."""
+        intermediate = self.INTERMEDIATE_TOOLS
         for msg in messages:
-            if isinstance(msg, ModelRequest):
-                for part in msg.parts:
-                    if (isinstance(part, ToolReturnPart)
-                            and part.content is not None
-                            and part.tool_name not in self.INTERMEDIATE_TOOLS):
-                        parts.append(part)
-        return parts
+            if type(msg) is not ModelRequest:
+                continue
+            for part in msg.parts:
+                # isinstance: ToolReturnPart has subclasses (tool search, capabilities)
+                if (isinstance(part, ToolReturnPart)
+                        and part.content is not None
+                        and part.tool_name not in intermediate):
+                    yield part
 
     def _normalize_content(self, content: Any) -> List[Any]:
         """Normalize content to a list (wraps single items)."""
@@ -415,20 +524,14 @@ class SourceDataBuilder:
         Returns:
             Formatted line or None if item is not Sourceable
         """
-        tag = SourceRegistry.register_sourceable(registry, item)
+        fields = _sourceable_fields(item)
+        if fields is None or not fields[0]:
+            return None
+        url, title, source_name, summary = fields
+        tag = registry.register(
+            url=url, title=title, source_name=source_name, description=summary)
         if not tag:
             return None
-        title = getattr(item, 'title', '') or ''
-        summary = (
-            getattr(item, 'body', '') or
-            getattr(item, 'summary', '') or
-            getattr(item, 'text', '') or ''
-            )[:200]
-        source_name = (
-            getattr(item, 'source', '') or
-            getattr(item, 'source_name', '') or
-            getattr(item, 'author_handle', '') or ''
-            )
         source_item = registry.lookup_by_key(tag)
         confidence = f" [{source_item.confidence_level}]" if source_item else ""
         return f"- {tag} {title} [via {source_name}]{confidence}: {summary}"
@@ -37,6 +37,16 @@ llm = Praetor()
 # Track running query tasks per chat so they can be cancelled
 _running_tasks: dict[int, asyncio.Task] = {}
 
+# The bot's own @username never changes while running; fetched on first use
+_bot_username: str | None = None
+
+
+async def get_bot_username() -> str:
+    global _bot_username
+    if _bot_username is None:
+        bot_info = await bot.get_me()
+        _bot_username = f"@{bot_info.username}"
+    return _bot_username
 
 
 @dp.message(CommandStart())
@@ -94,33 +104,62 @@ async def stop_query(message: types.Message):
         await message.reply("No query is running.")
 
 
+# Markdown → Telegram HTML patterns, applied to every outgoing chunk
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\((https?://[^\)]+)\)')
+_MD_TRIPLE_BOLD_RE = re.compile(r'\*\*\*(.+?)\*\*\*')
+_MD_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_MD_STAR_BOLD_RE = re.compile(r'\*([^*\n]+)\*')
+_MD_ITALIC_RE = re.compile(r'_([^_\n]+)_')
+_MD_HEADING_RE = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+
+
+def _escape_html(s: str) -> str:
+    return s.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _prose_to_html(part: str) -> str:
+    part = _escape_html(part)
+    part = _MD_TRIPLE_BOLD_RE.sub(r'<b>\1</b>', part)
+    part = _MD_BOLD_RE.sub(r'<b>\1</b>', part)
+    part = _MD_STAR_BOLD_RE.sub(r'<b>\1</b>', part)
+    part = _MD_ITALIC_RE.sub(r'<i>\1</i>', part)
+    return _MD_HEADING_RE.sub('', part)
+
+
 def markdown_to_html(text: str) -> str:
     """Convert markdown formatting to Telegram HTML."""
-    def escape(s: str) -> str:
-        return s.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-
-    # Split on markdown links so URLs are handled separately from prose
     text = text.replace('`', '') # Remove backticks
-    parts = re.split(r'(\[[^\]]+\]\(https?://[^\)]+\))', text)
+    # Walk the markdown links so URLs are handled separately from prose
     result = []
-    for part in parts:
-        m = re.fullmatch(r'\[([^\]]+)\]\((https?://[^\)]+)\)', part)
-        if m:
-            link_text = escape(m.group(1))
-            url = m.group(2).replace('&', '&amp;')
-            result.append(f'<a href="{url}">{link_text}</a>')
-        else:
-            part = escape(part)
-            part = re.sub(r'\*\*\*(.+?)\*\*\*', r'<b>\1</b>', part)
-            part = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', part)
-            part = re.sub(r'\*([^*\n]+)\*', r'<b>\1</b>', part)
-            part = re.sub(r'_([^_\n]+)_', r'<i>\1</i>', part)
-            part = re.sub(r'`([^`]+)`', r'<code>\1</code>', part)
-            part = re.sub(r'^#{1,6}\s+', '', part, flags=re.MULTILINE)
-            result.append(part)
+    pos = 0
+    for m in _MD_LINK_RE.finditer(text):
+        if m.start() > pos:
+            result.append(_prose_to_html(text[pos:m.start()]))
+        link_text = _escape_html(m.group(1))
+        url = m.group(2).replace('&', '&amp;')
+        result.append(f'<a href="{url}">{link_text}</a>')
+        pos = m.end()
+    if pos < len(text):
+        result.append(_prose_to_html(text[pos:]))
     return ''.join(result)
 
 
+def _split_oversized(paragraph: str, chunk_size: int):
+    """Yield pieces of at most chunk_size, breaking at the last newline or
+    space in each window so markdown runs and links are not cut mid-token."""
+    start, end = 0, len(paragraph)
+    while end - start > chunk_size:
+        limit = start + chunk_size
+        cut = paragraph.rfind('\n', start, limit)
+        if cut <= start:
+            cut = paragraph.rfind(' ', start, limit)
+        if cut <= start:
+            cut = limit
+        yield paragraph[start:cut]
+        start = cut
+    yield paragraph[start:]
+
+
 async def send_long_message(
             message: types.Message,
             text: str,
@@ -149,25 +188,25 @@ async def send_long_message(
                 else:
                     logger.error("Failed to send message chunk after 3 attempts", exc_info=True)
 
-    paragraphs_split = text.split('\n\n')
-    chunk = ""
-    for paragraph in paragraphs_split:
+    paragraphs: list[str] = []
+    size = 0
+    for paragraph in text.split('\n\n'):
         if len(paragraph) > chunk_size:
             # send the current chunk because we can't add anymore to it.
             # then split the long paragraph directly into more chunks
-            if chunk:
-                await send_chunk(chunk)
-                chunk = ""
-            # If a single paragraph exceeds the chunk size, split it directly
-            for i in range(0, len(paragraph), chunk_size):
-                await send_chunk(paragraph[i:i + chunk_size])
-        elif len(chunk) + len(paragraph) > chunk_size:
-            await send_chunk(chunk)
-            chunk = paragraph + "\n\n"
+            if paragraphs:
+                await send_chunk("\n\n".join(paragraphs))
+                paragraphs, size = [], 0
+            for piece in _split_oversized(paragraph, chunk_size):
+                await send_chunk(piece)
+        elif size + len(paragraph) > chunk_size:
+            await send_chunk("\n\n".join(paragraphs))
+            paragraphs, size = [paragraph], len(paragraph) + 2
         else:
-            chunk += paragraph + "\n\n"
-    if chunk:
-        await send_chunk(chunk)
+            paragraphs.append(paragraph)
+            size += len(paragraph) + 2
+    if paragraphs:
+        await send_chunk("\n\n".join(paragraphs))
     return sent_ids
 
 
@@ -180,11 +219,9 @@ async def send_trending_topics(message: types.Message):
     if not topics:
         await message.answer("No trending topics found on Bluesky.")
         return
-    # convert topics to strings
-    topics = "\n\n".join([str(topic) for topic in topics])
     await send_long_message(
         message=message,
-        text=topics,
+        text="\n\n".join(map(str, topics)),
         disable_web_page_preview=True
     )
 
@@ -230,8 +267,7 @@ async def regular_message(message: types.Message):
         return
 
     # only respond when @mentioned in group chats
-    bot_info = await bot.get_me()
-    bot_username = f"@{bot_info.username}"
+    bot_username = await get_bot_username()
     if bot_username.lower() not in message.text.lower():
         return
 
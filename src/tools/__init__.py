@@ -7,6 +7,7 @@ from src.tools.bsky import (
     search_bluesky_posts,
     get_bluesky_profile,
     get_author_feed,
+    get_bluesky_profile_and_feed,
     get_trending_topics
     )
 from src.tools.rss import (
@@ -33,6 +34,7 @@ EXPLORATOR_TOOLSET = FunctionToolset([
     search_bluesky_posts,
     get_bluesky_profile,
     get_author_feed,
+    get_bluesky_profile_and_feed,
     get_trending_topics,
     search_wikipedia,
     search_reddit_history,
@@ -1,11 +1,15 @@
+import asyncio
 import logging
+from functools import cached_property, lru_cache
 
-from atproto import AsyncClient
-from atproto_client.exceptions import RequestErrorBase
+import httpx
 from pydantic_ai import RunContext
 from pydantic import BaseModel
 
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
+
+if TYPE_CHECKING:
+    from atproto import AsyncClient
 
 from ..settings import BlueSkyCredentials
 from ..ai import AgentDeps
@@ -20,7 +24,7 @@ class BlueskyPost(BaseModel):
     post_id: str | int
     tag: str = ""
 
-    @property
+    @cached_property
     def source_url(self) -> str:
         return f"https://bsky.app/profile/{self.author_handle}/post/{self.post_id}"
 
@@ -30,17 +34,18 @@ class BlueskyPost(BaseModel):
         return self.source_url
 
     def __str__(self) -> str:
-        return "\n".join([
-                f"Author: {self.author_handle}",
-                f"Content: {self.text}",
-                f"URL: {self.url}",
-                "---------"
-            ])
+        return (
+            f"Author: {self.author_handle}\n"
+            f"Content: {self.text}\n"
+            f"URL: {self.url}\n"
+            "---------"
+        )
 
     @classmethod
     def from_atproto(cls, post) -> "BlueskyPost":
-        post_id = post.uri.split("/")[-1]
-        return cls(
+        # atproto has already validated the response; skip re-validation
+        post_id = post.uri.rpartition("/")[2]
+        return cls.model_construct(
             author_handle=post.author.handle,
             text=post.record.text,
             post_id=post_id
@@ -61,14 +66,26 @@ class BlueskyProfile(BaseModel):
         return f"https://bsky.app/profile/{self.handle}"
 
     def __str__(self) -> str:
-        return "\n".join([
-                f"Profile Information for @{self.handle}:",
-                f"Display Name: {self.display_name}",
-                f"Description: {self.description or 'N/A'}",
-                f"Followers: {self.followers_count}",
-                f"Following: {self.follows_count}",
-                f"Posts: {self.posts_count}"
-            ])
+        return (
+            f"Profile Information for @{self.handle}:\n"
+            f"Display Name: {self.display_name}\n"
+            f"Description: {self.description or 'N/A'}\n"
+            f"Followers: {self.followers_count}\n"
+            f"Following: {self.follows_count}\n"
+            f"Posts: {self.posts_count}"
+        )
+
+    @classmethod
+    def from_atproto(cls, handle: str, profile) -> "BlueskyProfile":
+        # atproto has already validated the response; skip re-validation
+        return cls.model_construct(
+            handle=handle,
+            display_name=profile.display_name or "",
+            description=profile.description,
+            followers_count=profile.followers_count or 0,
+            follows_count=profile.follows_count or 0,
+            posts_count=profile.posts_count or 0
+        )
 
 
 class BlueskyTrendingTopic(BaseModel):
@@ -106,14 +123,23 @@ class BlueskyTrendingTopic(BaseModel):
 
     def __str__(self) -> str:
         # Use display_name if available, otherwise fall back to topic
-        name = self.title
-        lines = [f"Topic: {name}", f"Feed: {self.feed_url}"]
+        text = f"Topic: {self.title}\nFeed: {self.feed_url}"
         if self.description:
-            lines.append(f"Description: {self.description}")
-        return "\n".join(lines)
+            return f"{text}\nDescription: {self.description}"
+        return text
 
-async def bluesky_login() -> AsyncClient:
-    client = AsyncClient()
+# Every call goes to the same PDS host. httpx's default 5s keepalive expiry
+# drops the connection between agent tool calls, so keep it warm longer.
+BSKY_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300)
+BSKY_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+
+async def bluesky_login() -> "AsyncClient":
+    # atproto builds its whole generated namespace on import (~0.7s), so it is
+    # imported on first Bluesky call rather than at bot startup.
+    from atproto import AsyncClient, AsyncRequest
+
+    client = AsyncClient(request=AsyncRequest(limits=BSKY_LIMITS, timeout=BSKY_TIMEOUT))
     await client.login(
         login=BlueSkyCredentials.HANDLE,
         password=BlueSkyCredentials.APP_PASSWORD
@@ -121,13 +147,73 @@ async def bluesky_login() -> AsyncClient:
     return client
 
 
+# One logged-in client shared by every Bluesky call. atproto refreshes the
+# access JWT itself, so createSession only runs on first use, after an auth
+# failure (see reset_on_auth_error) or when a new event loop takes over.
+_client: Optional["AsyncClient"] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_client_lock: Optional[asyncio.Lock] = None
+
+
+async def get_client() -> "AsyncClient":
+    """Return the shared logged-in client, logging in on first use."""
+    global _client, _client_loop, _client_lock
+    loop = asyncio.get_running_loop()
+    if _client is not None and _client_loop is loop:
+        return _client
+    if _client_lock is None or _client_loop is not loop:
+        _client, _client_loop, _client_lock = None, loop, asyncio.Lock()
+    async with _client_lock:
+        if _client is None:
+            _client = await bluesky_login()
+    return _client
+
+
+def reset_client() -> None:
+    """Drop the shared client so the next call logs in again."""
+    global _client
+    _client = None
+
+
+# Error codes the PDS returns (with HTTP 400) when the session token is stale
+_EXPIRED_TOKEN_ERRORS = frozenset({"ExpiredToken", "InvalidToken"})
+
+
+def reset_on_auth_error(error: Exception) -> None:
+    """Drop the shared client only if ``error`` means the session is no longer valid.
+
+    Bad handles, rate limits and network errors keep the session; logging in
+    again for those would only hit createSession's own rate limit.
+    """
+    from atproto_client.exceptions import BadRequestError, UnauthorizedError
+
+    if isinstance(error, UnauthorizedError):
+        reset_client()
+    elif isinstance(error, BadRequestError):
+        content = getattr(error.response, "content", None)
+        if getattr(content, "error", None) in _EXPIRED_TOKEN_ERRORS:
+            reset_client()
+
+
+async def close_client() -> None:
+    """Close the shared client's connection pool; call once on shutdown."""
+    client = _client
+    reset_client()
+    if client is not None:
+        await client.request.close()
+
+
+BSKY_SUFFIX = '.bsky.social'
+
+
+@lru_cache(maxsize=1024)
 def sanitize_handle(handle: str) -> str:
     """Sanitizes a Bluesky handle by removing '@' if present."""
-    if 'did:plc:' in handle:
-        return handle  # Assume it's already a DID and return as is
     handle = handle.strip().lstrip('@')
-    if not '.bsky.social' in handle:
-        handle += '.bsky.social'
+    if handle.startswith('did:plc:'):
+        return handle  # Assume it's already a DID and return as is
+    if not handle.endswith(BSKY_SUFFIX):
+        handle += BSKY_SUFFIX
     return handle
 
 
@@ -148,8 +234,10 @@ async def search_bluesky_posts(
         search_bluesky_posts(query="artificial intelligence", limit=20)
     """
     await ctx.deps.update_chat(f"_Searching Bluesky Posts: {query}_")
+    from atproto_client.exceptions import RequestErrorBase
+
     try:
-        client = await bluesky_login()
+        client = await get_client()
         results = await client.app.bsky.feed.search_posts(
             params={
                 "q": query,
@@ -161,6 +249,7 @@ async def search_bluesky_posts(
             return []
     except RequestErrorBase as e:
         logger.error(f"Bluesky search failed for '{query}': {e}")
+        reset_on_auth_error(e)
         return []
 
     posts = [BlueskyPost.from_atproto(post) for post in results.posts]
@@ -186,26 +275,22 @@ async def get_bluesky_profile(
     """
     handle = sanitize_handle(handle)
     await ctx.deps.update_chat(f"_Checking {handle} profile_")
+    from atproto_client.exceptions import RequestErrorBase
+
     try:
-        client = await bluesky_login()
+        client = await get_client()
         profile = await client.app.bsky.actor.get_profile(
                 params={"actor": handle}
             )
     except RequestErrorBase as e:
         logger.error(f"Bluesky profile lookup failed for '{handle}': {e}")
+        reset_on_auth_error(e)
         return None
     if not profile:
         logger.warning(f"No Bluesky profile found for handle: {handle}")
         return None
 
-    result = BlueskyProfile(
-        handle=handle,
-        display_name=profile.display_name or "",
-        description=profile.description,
-        followers_count=profile.followers_count or 0,
-        follows_count=profile.follows_count or 0,
-        posts_count=profile.posts_count or 0
-    )
+    result = BlueskyProfile.from_atproto(handle, profile)
     SourceRegistry.register_one(ctx.deps.source_registry, result)
     return result
 
@@ -226,8 +311,10 @@ async def get_author_feed(ctx: RunContext[AgentDeps], handle: str, limit: int =
     """
     handle = sanitize_handle(handle)
     await ctx.deps.update_chat(f"_Checking {handle}'s feed_")
+    from atproto_client.exceptions import RequestErrorBase
+
     try:
-        client = await bluesky_login()
+        client = await get_client()
         results = await client.app.bsky.feed.get_author_feed(
             params={"actor": handle, "limit": limit}
         )
@@ -236,6 +323,7 @@ async def get_author_feed(ctx: RunContext[AgentDeps], handle: str, limit: int =
             return []
     except RequestErrorBase as e:
         logger.error(f"Bluesky author feed failed for '{handle}': {e}")
+        reset_on_auth_error(e)
         return []
 
     posts = [BlueskyPost.from_atproto(item.post) for item in results.feed]
@@ -243,14 +331,70 @@ async def get_author_feed(ctx: RunContext[AgentDeps], handle: str, limit: int =
     return posts
 
 
+async def get_bluesky_profile_and_feed(
+            ctx: RunContext[AgentDeps],
+            handle: str,
+            limit: int = 30
+        ) -> List[BlueskyProfile | BlueskyPost]:
+    """Fetches a Bluesky profile and its recent posts together in one call.
+
+    Prefer this over calling get_bluesky_profile and get_author_feed one
+    after the other; both requests are sent at the same time.
+
+    Args:
+        handle (str): The profile handle (same formats as get_bluesky_profile)
+        limit (int, optional): Maximum posts to return. Defaults to 30.
+
+    Returns:
+        List[BlueskyProfile | BlueskyPost]: The profile first (if found), then its recent posts.
+
+    Example:
+        get_bluesky_profile_and_feed(handle="newsaccount.bsky.social", limit=20)
+    """
+    handle = sanitize_handle(handle)
+    await ctx.deps.update_chat(f"_Checking {handle} profile and feed_")
+    from atproto_client.exceptions import RequestErrorBase
+
+    try:
+        client = await get_client()
+    except RequestErrorBase as e:
+        logger.error(f"Bluesky login failed: {e}")
+        return []
+    profile, feed = await asyncio.gather(
+        client.app.bsky.actor.get_profile(params={"actor": handle}),
+        client.app.bsky.feed.get_author_feed(params={"actor": handle, "limit": limit}),
+        return_exceptions=True,
+    )
+
+    # One failing half should not discard the other
+    for outcome in (profile, feed):
+        if isinstance(outcome, RequestErrorBase):
+            logger.error(f"Bluesky profile/feed lookup failed for '{handle}': {outcome}")
+            reset_on_auth_error(outcome)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+
+    results: List[BlueskyProfile | BlueskyPost] = []
+    if profile and not isinstance(profile, RequestErrorBase):
+        results.append(BlueskyProfile.from_atproto(handle, profile))
+    if feed and not isinstance(feed, RequestErrorBase):
+        results.extend(BlueskyPost.from_atproto(item.post) for item in feed.feed)
+    if not results:
+        logger.warning(f"No Bluesky profile or posts found for handle: {handle}")
+    SourceRegistry.register_all(ctx.deps.source_registry, results)
+    return results
+
+
 async def trending_topics() -> List[BlueskyTrendingTopic]:
     """Fetches and returns the current trending topics on Bluesky.
 
     Returns:
         List[BlueskyTrendingTopic]: List of trending topics.
     """
+    from atproto_client.exceptions import RequestErrorBase
+
     try:
-        client = await bluesky_login()
+        client = await get_client()
         results = await client.app.bsky.unspecced.get_trending_topics()
 
         # NOTE: Could add fallback to results.suggested if results.topics is empty
@@ -260,10 +404,11 @@ async def trending_topics() -> List[BlueskyTrendingTopic]:
 
     except RequestErrorBase as e:
         logger.error(f"Bluesky trending topics API call failed: {e}")
+        reset_on_auth_error(e)
         return []
 
     return [
-        BlueskyTrendingTopic(
+        BlueskyTrendingTopic.model_construct(
             topic=topic.topic,
             link=topic.link,
             display_name=getattr(topic, 'display_name', None),
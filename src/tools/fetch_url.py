@@ -1,12 +1,13 @@
 import asyncio
 import logging
+import time
 from typing import Optional
 from urllib.parse import urlparse
 
 import trafilatura
 from pydantic import BaseModel
 from pydantic_ai import RunContext
-from playwright.async_api import async_playwright, Browser
+from playwright.async_api import async_playwright, Browser, BrowserContext
 
 from ..ai import AgentDeps
 
@@ -14,6 +15,10 @@ logger = logging.getLogger(__name__)
 
 MAX_BODY_CHARS = 3000  # ~750 tokens
 
+PAGE_CACHE_SIZE = 512
+PAGE_CACHE_TTL = 60 * 60    # seconds to reuse an extracted page
+FAILED_FETCH_TTL = 5 * 60   # seconds to remember an unreadable URL
+
 
 class BrowserManager:
     """Manages a headless Chromium instance with idle-timeout auto-shutdown.
@@ -29,25 +34,31 @@ class BrowserManager:
     def __init__(self):
         self._playwright = None
         self._browser: Browser | None = None
+        # One context for every fetch so Chromium's HTTP cache is reused
+        self._context: BrowserContext | None = None
         self._last_used: float = 0.0
         self._idle_task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
 
-    async def _get_browser(self) -> Browser:
+    async def _get_context(self) -> BrowserContext:
         if self._browser is None:
+            self._loop = asyncio.get_running_loop()
             self._playwright = await async_playwright().start()
             self._browser = await self._playwright.chromium.launch(headless=True)
+            self._context = await self._browser.new_context()
             self._idle_task = asyncio.create_task(self._idle_watchman())
             logger.info("Chromium launched")
-        self._last_used = asyncio.get_event_loop().time()
-        return self._browser
+        self._last_used = self._loop.time()
+        return self._context
 
     async def _idle_watchman(self):
         """Background task: close the browser after IDLE_TIMEOUT of inactivity."""
+        loop = asyncio.get_running_loop()
         while True:
             await asyncio.sleep(self.CHECK_INTERVAL)
             if self._browser is None:
                 break
-            idle = asyncio.get_event_loop().time() - self._last_used
+            idle = loop.time() - self._last_used
             if idle >= self.IDLE_TIMEOUT:
                 logger.info(f"Chromium idle for {idle:.0f}s — closing")
                 await self.close()
@@ -56,12 +67,13 @@ class BrowserManager:
     async def fetch(self, url: str) -> str | None:
         """Render a URL with headless Chromium and return the full HTML."""
         try:
-            browser = await self._get_browser()
-            page = await browser.new_page()
-            await page.goto(url, wait_until="networkidle", timeout=15000)
-            html = await page.content()
-            await page.close()
-            return html
+            context = await self._get_context()
+            page = await context.new_page()
+            try:
+                await page.goto(url, wait_until="networkidle", timeout=15000)
+                return await page.content()
+            finally:
+                await page.close()
         except Exception as e:
             logger.warning(f"Chromium fetch failed for {url}: {e}")
             await self.close()   # reset so next call gets a fresh browser
@@ -72,6 +84,9 @@ class BrowserManager:
         if self._idle_task:
             self._idle_task.cancel()
             self._idle_task = None
+        if self._context:
+            await self._context.close()
+            self._context = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -129,10 +144,11 @@ def _is_supported_url(url: str) -> bool:
 async def _fetch_page_from_url(url: str) -> Optional[FetchedPage]:
     """Fetch and extract a page from a direct URL."""
     try:
-        # Tier 1: trafilatura fetches and extracts directly (~0.5s)
-        html = trafilatura.fetch_url(url)
+        # Tier 1: trafilatura fetches and extracts directly (~0.5s). Download
+        # and extraction both block, so they run on worker threads
+        html = await asyncio.to_thread(trafilatura.fetch_url, url)
         if html:
-            page = _extract(html, url)
+            page = await asyncio.to_thread(_extract, html, url)
             if page:
                 return page
 
@@ -140,7 +156,7 @@ async def _fetch_page_from_url(url: str) -> Optional[FetchedPage]:
         logger.info(f"Trafilatura failed for {url}, trying Chromium")
         html = await _browser_manager.fetch(url)
         if html:
-            return _extract(html, url)
+            return await asyncio.to_thread(_extract, html, url)
 
     except Exception as e:
         logger.warning(f"fetch_url failed for {url}: {e}")
@@ -148,6 +164,39 @@ async def _fetch_page_from_url(url: str) -> Optional[FetchedPage]:
     return None
 
 
+# url -> (expires_at, page or None for a failed fetch); oldest entry first
+_page_cache: dict[str, tuple[float, Optional[FetchedPage]]] = {}
+# url -> running fetch, so concurrent requests for one URL share it
+_inflight: dict[str, asyncio.Task] = {}
+
+
+async def _load_page(url: str) -> Optional[FetchedPage]:
+    page = await _fetch_page_from_url(url)
+    _page_cache.pop(url, None)
+    if len(_page_cache) >= PAGE_CACHE_SIZE:
+        del _page_cache[next(iter(_page_cache))]
+    ttl = PAGE_CACHE_TTL if page else FAILED_FETCH_TTL
+    _page_cache[url] = (time.monotonic() + ttl, page)
+    return page
+
+
+async def _get_page(url: str) -> Optional[FetchedPage]:
+    """Fetch a page, reusing recent results and in-flight fetches for the same URL."""
+    hit = _page_cache.get(url)
+    if hit is not None and hit[0] > time.monotonic():
+        page = hit[1]
+    else:
+        task = _inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(_load_page(url))
+            _inflight[url] = task
+            task.add_done_callback(lambda _: _inflight.pop(url, None))
+        # A cancelled caller must not cancel the fetch other callers await
+        page = await asyncio.shield(task)
+    # Callers set page.tag per chat, so never hand out the cached instance
+    return page.model_copy() if page else None
+
+
 async def fetch_url(ctx: RunContext[AgentDeps], source_key: str) -> Optional[FetchedPage]:
     """Fetches full article text for a source already collected in this session.
 
@@ -178,7 +227,7 @@ async def fetch_url(ctx: RunContext[AgentDeps], source_key: str) -> Optional[Fet
 
     url = source_item.url
     await ctx.deps.update_chat(f"_Reading: {source_item.title or url}_")
-    page = await _fetch_page_from_url(url)
+    page = await _get_page(url)
     if page:
         page.tag = source_key.strip()
     return page
@@ -202,7 +251,7 @@ async def fetch_webpage(ctx: RunContext[AgentDeps], url: str) -> Optional[Fetche
         return None
 
     await ctx.deps.update_chat(f"_Reading: {url}_")
-    page = await _fetch_page_from_url(url.strip())
+    page = await _get_page(url.strip())
     if page is None:
         return None
 
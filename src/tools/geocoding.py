@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from typing import Optional
 
 from geopy.geocoders import Photon
@@ -51,6 +52,11 @@ class GeocodingClient:
             try:
                 coordinates = await self.geocode(location)
                 if coordinates:
+                    # Zipcode and street-level matches already carry the
+                    # postcode; only fall back to reverse lookups without one
+                    postcode = coordinates.raw.get("properties", {}).get("postcode")
+                    if postcode:
+                        return postcode
                     # Try reverse geocode, offset slightly if city-level result lacks postcode
                     for lat_offset in [0, 0.005]:
                         await asyncio.sleep(2)
@@ -74,10 +80,45 @@ class GeocodingClient:
         return None
 
 
+ZIPCODE_CACHE_TTL = 24 * 60 * 60  # seconds; places don't move
+ZIPCODE_CACHE_SIZE = 1024
+
+# normalized location -> (expires_at, postcode); oldest entry first
+_zipcode_cache: dict[str, tuple[float, str]] = {}
+
+# One client (and aiohttp session) reused by every lookup on the running loop
+_client: Optional[GeocodingClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_client() -> GeocodingClient:
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = GeocodingClient()
+        _client_loop = loop
+    return _client
+
+
+async def close_geocoder() -> None:
+    """Close the shared geocoder session; call once on shutdown."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.geolocator.__aexit__(None, None, None)
+    _client = _client_loop = None
+
+
 async def location_to_zipcode(location: str) -> str | None:
     """Converts a location string to a zipcode using geocoding."""
-    client = GeocodingClient()
-    async with client.geolocator:
-        # NOTE: __aenter__ and __aexit__ are handled
-        # by the geolocator context manager to ensure proper session management
-        return await client.location_to_zipcode(location)
\ No newline at end of file
+    key = location.strip().lower()
+    hit = _zipcode_cache.get(key)
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+
+    postcode = await _get_client().location_to_zipcode(location)
+    if postcode:
+        _zipcode_cache.pop(key, None)
+        if len(_zipcode_cache) >= ZIPCODE_CACHE_SIZE:
+            del _zipcode_cache[next(iter(_zipcode_cache))]
+        _zipcode_cache[key] = (time.monotonic() + ZIPCODE_CACHE_TTL, postcode)
+    return postcode
@@ -3,6 +3,40 @@ import logging
 from typing import Optional
 
 import aiohttp
+import orjson
+
+
+# One pooled session shared by every AsyncHTTPClient so repeat calls to the
+# same API reuse warm connections instead of paying DNS + TLS setup each time.
+_shared_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """Return the shared session, creating it on first use (or after close)."""
+    global _shared_session
+    loop = asyncio.get_running_loop()
+    if (
+        _shared_session is None
+        or _shared_session.closed
+        or _shared_session._loop is not loop
+    ):
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+            )
+        )
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared session; call once on shutdown."""
+    global _shared_session
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
 
 
 class AsyncHTTPClient:
@@ -17,12 +51,12 @@ class AsyncHTTPClient:
         self.logger = logging.getLogger(self.__class__.__name__)
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self.session = get_shared_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # The shared session outlives this client; close_shared_session() ends it.
+        self.session = None
 
     def build_url(self, endpoint: str) -> str:
         return f"{self.BASE_URL}/{endpoint}"
@@ -61,5 +95,5 @@ class AsyncHTTPClient:
     async def http_request(self, url: str, params: dict) -> tuple[int, dict]:
         """Makes a single HTTP GET request and returns (status, json_body)."""
         async with self.session.get(url, params=params) as response:
-            data = await response.json()
+            data = await response.json(loads=orjson.loads)
             return response.status, data
@@ -1,6 +1,7 @@
 from typing import Optional, List
 import logging
 
+from pydantic import TypeAdapter
 from pydantic_ai import RunContext
 
 from .models import Event, EventType
@@ -12,19 +13,26 @@ from ..http_client import AsyncHTTPClient
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole page of events in one pydantic-core call
+_EVENT_LIST = TypeAdapter(List[Event])
+
 
 class MobilizeClient(AsyncHTTPClient):
     BASE_URL = str(MobilizeEndpoints.API_ROOT)
 
+
+# Sent as repeated event_types query params on every search
+DEFAULT_EVENT_TYPES = (
+    EventType.RALLY.value,
+    EventType.SOLIDARITY_EVENT.value,
+    EventType.VISIBILITY_EVENT.value,
+    EventType.TOWN_HALL.value,
+)
+
 def build_params(zipcode: int | str, max_distance: Optional[int] = 75) -> dict:
     return {
         "zipcode": zipcode,
-        "event_types": [
-            EventType.RALLY.value,
-            EventType.SOLIDARITY_EVENT.value,
-            EventType.VISIBILITY_EVENT.value,
-            EventType.TOWN_HALL.value,
-        ],
+        "event_types": DEFAULT_EVENT_TYPES,
         "timeslot_start": "gte_now",
         "max_dist": max_distance,
     }
@@ -49,7 +57,8 @@ async def get_protests_for_llm(
             List[Event]: List of protest events near the location.
     """
     logger.info(
-        f"LLM Tool: get_protests_for_llm called with location={location}, max_distance={max_distance}"
+        "LLM Tool: get_protests_for_llm called with location=%s, max_distance=%s",
+        location, max_distance,
         )
     await ctx.deps.update_chat(f"_Finding protest events {max_distance} miles around {location}_")
     events = await get_events(location=location, max_distance=max_distance)
@@ -84,5 +93,4 @@ async def get_events(
         data = await client.request(endpoint="events", params=api_parameters)
     if data is None:
         return []
-    events = data.get("data") or []
-    return [Event(**event) for event in events]
+    return _EVENT_LIST.validate_python(data.get("data") or [])
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import cached_property
 from enum import Enum
 from typing import Optional, List
 import logging
@@ -8,8 +9,15 @@ from dateutil.parser import parse as parse_date
 
 logger = logging.getLogger(__name__)
 
+# English names for hand-built date strings (what strftime gives in the C locale)
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
 
-class EventType(Enum):
+
+class EventType(str, Enum):
     CANVASS = "CANVASS"
     PHONE_BANK = "PHONE_BANK"
     TEXT_BANK = "TEXT_BANK"
@@ -83,13 +91,6 @@ class Location(BaseModel):
     state_leg_district: Optional[str] = None
     state_senate_district: Optional[str] = None
 
-    @field_validator('location', mode='before')
-    @classmethod
-    def coerce_location(cls, v):
-        if isinstance(v, dict):
-            return Coordinates(**v)
-        return v
-
 
 class Timeslot(BaseModel):
     id: int
@@ -134,34 +135,8 @@ class Event(BaseModel):
     accessibility_notes: Optional[str] = None
     tag: str = ""
 
-    @field_validator('event_type', mode='before')
-    @classmethod
-    def coerce_event_type(cls, v):
-        if isinstance(v, str):
-            return EventType(v)
-        return v
-
-    @field_validator('sponsor', mode='before')
-    @classmethod
-    def coerce_sponsor(cls, v):
-        if isinstance(v, dict):
-            return Sponsor(**v)
-        return v
-
-    @field_validator('location', mode='before')
-    @classmethod
-    def coerce_location(cls, v):
-        if isinstance(v, dict):
-            return Location(**v)
-        return v
-
-    @field_validator('timeslots', mode='before')
-    @classmethod
-    def coerce_timeslots(cls, v):
-        if v and isinstance(v[0], dict):
-            return [Timeslot(**t) for t in v]
-        return v
-
+    # Nested models, enums and lists are validated natively by pydantic-core;
+    # only shapes it can't infer need a Python-level validator.
     @field_validator('tags', mode='before')
     @classmethod
     def coerce_tags(cls, v):
@@ -173,32 +148,48 @@ class Event(BaseModel):
     def source_url(self) -> str:
         return self.browser_url
 
-    @property
+    # Events are read-only once parsed, so the rendered strings below are
+    # built on first access and reused for every later prompt or message.
+
+    @cached_property
     def location_str(self) -> str:
-        return ", ".join([
-                self.location.venue,
-                self.location.locality,
-                self.location.region
-            ])
+        return f"{self.location.venue}, {self.location.locality}, {self.location.region}"
+
+    @property
+    def short_date(self) -> str:
+        """Start as '%Y-%m-%d %H:%M', built without strftime."""
+        d = self.timeslots[0].start_date
+        return f"{d.year}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
 
     @property
+    def long_date(self) -> str:
+        """Start as '%A, %B %d, %Y at %I:%M %p', built without strftime."""
+        d = self.timeslots[0].start_date
+        hour = d.hour % 12 or 12
+        meridiem = "AM" if d.hour < 12 else "PM"
+        return (
+            f"{_WEEKDAYS[d.weekday()]}, {_MONTHS[d.month]} {d.day:02d}, {d.year} "
+            f"at {hour:02d}:{d.minute:02d} {meridiem}"
+        )
+
+    @cached_property
     def telegram_message(self) -> str:
-        return '\n'.join([
-            f"_*{self.title}*_",
-            f"Date: {self.timeslots[0].start_date.strftime('%Y-%m-%d %H:%M')}",
-            f"Location: {self.location_str}",
-            f"Coordinates: {self.coordinates}",
-            f"Organizer: {self.sponsor.name}",
+        return (
+            f"_*{self.title}*_\n"
+            f"Date: {self.short_date}\n"
+            f"Location: {self.location_str}\n"
+            f"Coordinates: {self.coordinates}\n"
+            f"Organizer: {self.sponsor.name}\n"
             f"[More Info]({self.browser_url})"
-        ])
+        )
 
-    @property
+    @cached_property
     def coordinates(self) -> Optional[str]:
         if not self.location.location:
             return "N/A"
         return f"{self.location.location.latitude}, {self.location.location.longitude}"
 
-    @property
+    @cached_property
     def llm_context(self) -> str:
         """Returns a formatted string with of a single event for LLM context.
         FORMAT:
@@ -212,14 +203,14 @@ class Event(BaseModel):
             Summary: {summary}
             Description: {description}
         """
-        return '\n'.join([
-            f"Title: {self.title}",
-            f"Type: {self.event_type.value}",
-            f"Date: {self.timeslots[0].start_date.strftime('%A, %B %d, %Y at %I:%M %p')}",
-            f"Location: {self.location_str}",
-            f"Coordinates: {self.coordinates}",
-            f"Organizer: {self.sponsor.name}",
-            f"URL: {self.browser_url}",
-            f"Summary: {self.summary}",
-            f"Description: {self.description}",
-        ])
+        return (
+            f"Title: {self.title}\n"
+            f"Type: {self.event_type.value}\n"
+            f"Date: {self.long_date}\n"
+            f"Location: {self.location_str}\n"
+            f"Coordinates: {self.coordinates}\n"
+            f"Organizer: {self.sponsor.name}\n"
+            f"URL: {self.browser_url}\n"
+            f"Summary: {self.summary}\n"
+            f"Description: {self.description}"
+        )
@@ -1,4 +1,6 @@
+import time
 from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
 from typing import Optional, List
 import logging
 
@@ -9,6 +11,9 @@ from src import settings
 
 logger = logging.getLogger(__name__)
 
+_TZ_INFOS = settings.TZ_INFOS
+_UTC = _TZ_INFOS["UTC"]
+
 
 DATE_KEYS: List[str] = [
     "published",
@@ -20,6 +25,38 @@ DATE_KEYS: List[str] = [
 ]
 
 
+# Exact RFC 822 shapes most RSS feeds emit. Tried before the general dateutil
+# parser; named zones other than GMT/UTC are left to dateutil and TZ_INFOS.
+_RFC822_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %z",
+    "%a, %d %b %Y %H:%M:%S GMT",
+    "%a, %d %b %Y %H:%M:%S UTC",
+)
+
+
+def _parse_fast(date_str: str) -> Optional[datetime]:
+    """Parse ISO 8601 / RFC 822 dates without dateutil; None if no shape matches."""
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    for fmt in _RFC822_FORMATS:
+        try:
+            parsed = datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+        if not parsed.tzinfo:
+            parsed = parsed.replace(tzinfo=_UTC)
+        return parsed
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(date_str: str) -> datetime:
+    """Parse a feed date, memoized: feeds repeat the same pubDate strings across polls."""
+    return _parse_fast(date_str) or parse_date(date_str, tzinfos=_TZ_INFOS)
+
+
 class RSSFeedItem(BaseModel):
     """Represents a single RSS feed entry."""
     title: str
@@ -39,42 +76,44 @@ class RSSFeedItem(BaseModel):
         return self.link
 
     def __str__(self):
-        return "\n".join([
-                f"Title: {self.title}",
-                f"Source: {self.source_name}",
-                f"Published: {self.published}",
-                f"Relevance Score: {self.relevance_score}",
-                f"Link: {self.link}",
-                f"Summary: {self.summary}",
-                "-------------"
-            ])
+        return (
+            f"Title: {self.title}\n"
+            f"Source: {self.source_name}\n"
+            f"Published: {self.published}\n"
+            f"Relevance Score: {self.relevance_score}\n"
+            f"Link: {self.link}\n"
+            f"Summary: {self.summary}\n"
+            "-------------"
+        )
 
     def time_check(self, days: int) -> bool:
-        if not self.published:
-            return False
-        try:
-            return self.age < timedelta(days=days)
-        except Exception as e:
-            logger.error(
-                f"Error in time_check for entry '{self.title}': {e}\n"
-                f"Published date: {self.published}"
-                )
+        age_seconds = self.age_seconds
+        if age_seconds is None:
             return False
+        return age_seconds < days * 86400
 
-    @property
-    def age(self) -> Optional[timedelta]:
+    @cached_property
+    def published_ts(self) -> Optional[float]:
+        """Epoch seconds of the published date; naive dates are taken as UTC."""
         if not self.published:
             return None
-        try:
-            return datetime.now(
-                    tz=settings.TZ_INFOS["UTC"]
-                ) - self.published
-        except Exception as e:
-            logger.error(
-                f"Error calculating age for entry '{self.title}': {e}\n"
-                f"Published date: {self.published}"
-                )
+        published = self.published
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=_UTC)
+        return published.timestamp()
+
+    @property
+    def age_seconds(self) -> Optional[float]:
+        if self.published_ts is None:
             return None
+        return time.time() - self.published_ts
+
+    @property
+    def age(self) -> Optional[timedelta]:
+        age_seconds = self.age_seconds
+        if age_seconds is None:
+            return None
+        return timedelta(seconds=age_seconds)
 
     @property
     def freshness(self) -> Optional[float]:
@@ -83,11 +122,11 @@ class RSSFeedItem(BaseModel):
         as the threshold for freshness, but this can be adjusted as needed.
         """
         HOURS_THRESHOLD = 48
-        if self.age:
-            return max(0.0, 1.0 - (self.age.total_seconds()/(HOURS_THRESHOLD*3600)))
+        age_seconds = self.age_seconds
+        if age_seconds:
+            return max(0.0, 1.0 - (age_seconds/(HOURS_THRESHOLD*3600)))
         return 0.0
 
-
     @property
     def current(self) -> bool:
         """Determines if the feed is current (not outdated)."""
@@ -105,20 +144,15 @@ class RSSFeedItem(BaseModel):
         for key in DATE_KEYS:
             if entry.get(key):
                 try:
-                    parsed_date = parse_date(
-                        entry[key],
-                        tzinfos=settings.TZ_INFOS
-                        )
+                    parsed_date = _parse_cached(entry[key])
                     if not parsed_date.tzinfo:
                         parsed_date = parsed_date.replace(
-                            tzinfo=settings.TZ_INFOS["UTC"]
+                            tzinfo=_UTC
                         )
                     return parsed_date
                 except Exception:
                     continue
-        logger.debug(
-            f"Could not parse published date for entry: {entry.get('title')}"
-            )
+        logger.debug("Could not parse published date for entry: %s", entry.get('title'))
         return None
 
     @staticmethod
@@ -130,9 +164,7 @@ class RSSFeedItem(BaseModel):
             for media in entry["media_content"]:
                 if media.get("medium") == "image":
                     return media.get("url")
-        logger.debug(
-            f"Could not find thumbnail URL for entry: {entry.get('title')}"
-            )
+        logger.debug("Could not find thumbnail URL for entry: %s", entry.get('title'))
         return None
 
     @staticmethod
@@ -140,9 +172,7 @@ class RSSFeedItem(BaseModel):
         """Extracts tags from the entry if available."""
         if entry.get("tags"):
             return [t.get("term") for t in entry["tags"] if t.get("term")]
-        logger.debug(
-            f"Could not find tags for entry: {entry.get('title')}"
-            )
+        logger.debug("Could not find tags for entry: %s", entry.get('title'))
         return None
 
     @classmethod
@@ -52,7 +52,8 @@ PASS if ALL of the following are true:
 - Contains an OBJECTIVE: section with one clear, specific sentence describing the research goal
 - Contains a TASKS: section with a numbered list that includes at least one specific tool name
 - Tool names referenced are valid OSINT tools from this list: search_web, search_news,
-  search_bluesky_posts, get_bluesky_profile, get_author_feed, get_trending_topics,
+  search_bluesky_posts, get_bluesky_profile, get_author_feed, get_bluesky_profile_and_feed,
+  get_trending_topics,
   search_wikipedia, search_reddit_history, fetch_archived_page, fetch_url,
   get_gov_rss_feed, get_world_news_rss_feed,
   get_protests_for_llm, search_polymarket, get_polymarket_event, search_candidate_finance,
@@ -113,3 +113,18 @@ class TestAgentSettingsModelSettings:
         from src.agent_settings import AgentSettings
         s = AgentSettings(model="x", prompt_file="writer.md", think=False, temperature=0.1)
         assert s.instructions.startswith("# ")
+
+    def test_instructions_read_once(self):
+        from src.agent_settings import AgentSettings
+        s = AgentSettings(model="x", prompt_file="writer.md", think=False, temperature=0.1)
+        with patch("src.agent_settings.PROMPT_PATH") as prompt_path:
+            prompt_path.joinpath.return_value.read_text.return_value = "# cached"
+            assert s.instructions == "# cached"
+            assert s.instructions == "# cached"
+        prompt_path.joinpath.return_value.read_text.assert_called_once()
+
+    def test_models_share_one_provider(self):
+        from src.agent_settings import AgentsConfiguration
+        a = AgentsConfiguration.NUNTIUS.make_model()
+        b = AgentsConfiguration.COGITATOR.make_model()
+        assert a._provider is b._provider
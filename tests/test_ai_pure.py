@@ -1,8 +1,23 @@
 """Tests for pure logic in src/ai.py — no network, no agents."""
 import pytest
-from unittest.mock import AsyncMock
-
-from src.ai import strip_think_tags, CallCounter, ResearchPlan, ResearchObjective
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.ai import (
+    strip_think_tags,
+    strip_think_tags_async,
+    STRIP_IN_THREAD_CHARS,
+    CallCounter,
+    ResearchPlan,
+    ResearchObjective,
+    AgentDeps,
+    WritingPipeline,
+    _today_utc,
+    looks_final,
+    MIN_REVIEW_CHARS,
+    Nuntius,
+    Praetor,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -80,6 +95,48 @@ class TestStripThinkTags:
         assert strip_think_tags(text) == text
 
 
+class TestStripThinkTagsAsync:
+    async def test_short_output_stripped_inline(self):
+        with patch("src.ai.asyncio.to_thread") as to_thread:
+            result = await strip_think_tags_async("<think>x</think>Answer")
+        assert result == "Answer"
+        to_thread.assert_not_called()
+
+    async def test_long_output_stripped_in_thread(self):
+        text = "<think>x</think>" + "a" * (STRIP_IN_THREAD_CHARS + 1)
+        result = await strip_think_tags_async(text)
+        assert result == strip_think_tags(text)
+
+
+# ---------------------------------------------------------------------------
+# looks_final
+# ---------------------------------------------------------------------------
+
+class TestLooksFinal:
+    def test_short_confident_draft_is_final(self):
+        assert looks_final("The rally is on Saturday at City Hall [SOURCE_1].")
+
+    def test_short_hedging_draft_needs_review(self):
+        assert not looks_final("I'm not sure when the rally is.")
+        assert not looks_final("I could not find any upcoming events.")
+
+    def test_long_draft_needs_review(self):
+        assert not looks_final("a" * MIN_REVIEW_CHARS)
+
+
+# ---------------------------------------------------------------------------
+# _today_utc
+# ---------------------------------------------------------------------------
+
+class TestTodayUtc:
+    def test_matches_current_utc_date(self):
+        expected = datetime.now(timezone.utc).strftime("%B %d, %Y")
+        assert _today_utc() == expected
+
+    def test_cached_between_calls(self):
+        assert _today_utc() is _today_utc()
+
+
 # ---------------------------------------------------------------------------
 # CallCounter
 # ---------------------------------------------------------------------------
@@ -214,3 +271,279 @@ class TestResearchPlan:
         plan = ResearchPlan(query="empty")
         assert plan.pending_objectives() == []
         assert "empty" in plan.summary()
+
+
+# ---------------------------------------------------------------------------
+# WritingPipeline._write_candidates
+# ---------------------------------------------------------------------------
+
+class TestWriteCandidates:
+    def _make_pipeline(self, drafts, reviews):
+        pipeline = WritingPipeline(get_registry=MagicMock(), research=MagicMock())
+        pipeline._nuntius = MagicMock()
+        pipeline._nuntius.write = AsyncMock(side_effect=drafts)
+        pipeline._cogitator = MagicMock()
+        pipeline._cogitator.review = AsyncMock(side_effect=reviews)
+        return pipeline
+
+    async def test_returns_first_approved_draft(self):
+        pipeline = self._make_pipeline(
+            drafts=["draft A", "draft B", "draft C"],
+            reviews=["IMPROVE: more detail", "APPROVED", "APPROVED"],
+        )
+        deps = AgentDeps(update_chat=AsyncMock(), user_input="q")
+        with patch("src.ai.NUNTIUS_CANDIDATES", 3):
+            draft, feedback = await pipeline._write_candidates(deps, "context")
+        assert (draft, feedback) == ("draft B", "APPROVED")
+        assert pipeline._nuntius.write.await_count == 3
+
+    async def test_falls_back_to_first_draft_when_none_approved(self):
+        pipeline = self._make_pipeline(
+            drafts=["draft A", "draft B"],
+            reviews=["IMPROVE: x", "IMPROVE: y"],
+        )
+        deps = AgentDeps(update_chat=AsyncMock(), user_input="q")
+        with patch("src.ai.NUNTIUS_CANDIDATES", 2):
+            draft, feedback = await pipeline._write_candidates(deps, "context")
+        assert (draft, feedback) == ("draft A", "IMPROVE: x")
+
+    async def test_rejected_round_goes_straight_to_revision(self):
+        pipeline = self._make_pipeline(
+            drafts=["short A", "short B", "revised"],
+            reviews=["IMPROVE: x", "IMPROVE: y", "APPROVED"],
+        )
+        registry = MagicMock()
+        registry.substitute.side_effect = lambda text: text
+        pipeline._get_registry = lambda chat_id: registry
+        pipeline._build_writing_context = AsyncMock(return_value="context")
+        deps = AgentDeps(update_chat=AsyncMock(), user_input="q")
+        with patch("src.ai.NUNTIUS_CANDIDATES", 2), \
+                patch("src.ai.get_query_embedding", AsyncMock(return_value=None)), \
+                patch("src.ai.training_logger") as training_log:
+            final = await pipeline.write_and_review(deps)
+        assert final == "revised"
+        revision_input = pipeline._nuntius.write.await_args_list[2].args[1]
+        assert "Previous Draft:\nshort A" in revision_input
+        assert "Reviewer Feedback:\nIMPROVE: x" in revision_input
+        # the revision is reviewed once; the rejected draft is never re-reviewed
+        assert pipeline._cogitator.review.await_count == 3
+        assert training_log.record_nuntius.call_count == 3
+
+
+# ---------------------------------------------------------------------------
+# WritingPipeline short-draft review skip
+# ---------------------------------------------------------------------------
+
+class TestShortDraftReview:
+    def _make_pipeline(self):
+        registry = MagicMock()
+        registry.substitute.side_effect = lambda text: text
+        pipeline = WritingPipeline(get_registry=lambda chat_id: registry, research=MagicMock())
+        pipeline._nuntius = MagicMock()
+        pipeline._nuntius.write = AsyncMock(return_value="The rally is on Saturday.")
+        pipeline._cogitator = MagicMock()
+        pipeline._cogitator.review = AsyncMock(return_value="APPROVED")
+        pipeline._build_writing_context = AsyncMock(return_value="context")
+        return pipeline
+
+    async def _run(self, pipeline, skip_short_review):
+        deps = AgentDeps(update_chat=AsyncMock(), user_input="q")
+        with patch("src.ai.SKIP_SHORT_REVIEW", skip_short_review), \
+                patch("src.ai.get_query_embedding", AsyncMock(return_value=None)):
+            return await pipeline.write_and_review(deps)
+
+    async def test_short_draft_reviewed_by_default(self):
+        pipeline = self._make_pipeline()
+        await self._run(pipeline, skip_short_review=False)
+        pipeline._cogitator.review.assert_awaited_once()
+
+    async def test_short_draft_skips_review_when_enabled(self):
+        pipeline = self._make_pipeline()
+        assert await self._run(pipeline, skip_short_review=True) == "The rally is on Saturday."
+        pipeline._cogitator.review.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# Nuntius streaming
+# ---------------------------------------------------------------------------
+
+class TestNuntiusStreaming:
+    def _make_nuntius(self):
+        from pydantic_ai.models.test import TestModel
+        return Nuntius(model=TestModel(custom_output_text="one two three four"), instructions="")
+
+    async def test_streams_progress_when_interval_set(self):
+        nuntius = self._make_nuntius()
+        on_progress = AsyncMock()
+        with patch("src.ai.NUNTIUS_STREAM_INTERVAL", 1e-9):
+            output = await nuntius.write("q", "research", on_progress=on_progress)
+        assert output == "one two three four"
+        assert on_progress.await_count >= 1
+
+    async def test_no_progress_when_interval_disabled(self):
+        nuntius = self._make_nuntius()
+        on_progress = AsyncMock()
+        with patch("src.ai.NUNTIUS_STREAM_INTERVAL", 0):
+            output = await nuntius.write("q", "research", on_progress=on_progress)
+        assert output == "one two three four"
+        on_progress.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# Praetor.run_parallel_research
+# ---------------------------------------------------------------------------
+
+class TestRunParallelResearch:
+    async def test_preserves_order_and_isolates_failures(self):
+        praetor = Praetor()
+        praetor._research = MagicMock()
+        praetor._research.run_research = AsyncMock(
+            side_effect=["findings A", RuntimeError("boom"), "findings C"]
+        )
+        ctx = MagicMock()
+        ctx.deps = AgentDeps(update_chat=AsyncMock(), user_input="q")
+        output = await praetor.run_parallel_research(ctx, ["a", "b", "c"])
+        assert output.index("findings A") < output.index("Research failed") < output.index("findings C")
+        assert praetor._research.run_research.await_count == 3
+
+    async def test_directives_capped(self):
+        from src.ai import MAX_PARALLEL_DIRECTIVES
+        praetor = Praetor()
+        praetor._research = MagicMock()
+        praetor._research.run_research = AsyncMock(return_value="findings")
+        ctx = MagicMock()
+        ctx.deps = AgentDeps(update_chat=AsyncMock(), user_input="q")
+        directives = [f"d{i}" for i in range(MAX_PARALLEL_DIRECTIVES + 2)]
+        output = await praetor.run_parallel_research(ctx, directives)
+        assert praetor._research.run_research.await_count == MAX_PARALLEL_DIRECTIVES
+        assert "Not researched" in output
+        assert f"- d{MAX_PARALLEL_DIRECTIVES + 1}" in output
+
+
+# ---------------------------------------------------------------------------
+# Praetor.handle_query
+# ---------------------------------------------------------------------------
+
+class TestHandleQuery:
+    def _make_praetor(self):
+        praetor = Praetor()
+        praetor._warm_up_agents = MagicMock()
+        praetor.agent = MagicMock()
+        praetor.agent.run = AsyncMock(return_value=MagicMock(output="praetor answer", all_messages=lambda: []))
+        return praetor
+
+    async def test_model_error_falls_back_to_praetor(self):
+        from pydantic_ai.exceptions import UnexpectedModelBehavior
+        praetor = self._make_praetor()
+        praetor._handle_fast_path = AsyncMock(side_effect=UnexpectedModelBehavior("bad output"))
+        update_chat = AsyncMock()
+        with patch("src.ai.FAST_PATH_MAX_WORDS", 8), patch("src.ai.training_logger"):
+            await praetor.handle_query("rallies in Oakland", 1, update_chat)
+        praetor._handle_fast_path.assert_awaited_once()
+        praetor.agent.run.assert_awaited_once()
+        update_chat.assert_any_await("praetor answer")
+        assert (praetor._fast_path_count, praetor._query_count) == (0, 1)
+        assert not praetor._active_chats
+
+    async def test_warm_up_failure_is_logged(self, caplog):
+        import asyncio
+        praetor = self._make_praetor()
+        praetor._warm_up_agents = MagicMock(side_effect=RuntimeError("bad model config"))
+        with patch("src.ai.FAST_PATH_MAX_WORDS", 0), patch("src.ai.training_logger"):
+            await praetor.handle_query("hello", 1, AsyncMock())
+            await asyncio.gather(praetor._warm_up_task, return_exceptions=True)
+            await asyncio.sleep(0)
+        assert "Agent warm-up failed: bad model config" in caplog.text
+
+    async def test_disabled_fast_path_not_counted(self):
+        praetor = self._make_praetor()
+        praetor._handle_fast_path = AsyncMock()
+        with patch("src.ai.FAST_PATH_MAX_WORDS", 0), patch("src.ai.training_logger"):
+            await praetor.handle_query("rallies in Oakland", 1, AsyncMock())
+        praetor._handle_fast_path.assert_not_awaited()
+        assert praetor._query_count == 0
+
+
+# ---------------------------------------------------------------------------
+# Praetor._get_registry
+# ---------------------------------------------------------------------------
+
+class TestRegistryEviction:
+    def test_oldest_idle_registry_evicted(self):
+        praetor = Praetor()
+        with patch("src.ai.MAX_CHATS", 2):
+            first = praetor._get_registry(1)
+            praetor._get_registry(2)
+            praetor._get_registry(1)
+            praetor._get_registry(3)
+        assert list(praetor._registries) == [1, 3]
+        assert praetor._get_registry(1) is first
+
+    def test_registry_of_running_query_kept(self):
+        praetor = Praetor()
+        praetor._active_chats[1] += 1
+        with patch("src.ai.MAX_CHATS", 2):
+            running = praetor._get_registry(1)
+            praetor._get_registry(2)
+            praetor._get_registry(3)
+        assert list(praetor._registries) == [1, 3]
+        assert praetor._registries[1] is running
+
+
+# ---------------------------------------------------------------------------
+# WritingPipeline speculative redraft
+# ---------------------------------------------------------------------------
+
+class TestSpeculativeRedraft:
+    def _make_pipeline(self, drafts, reviews):
+        registry = MagicMock()
+        registry.substitute.side_effect = lambda text: text
+        pipeline = WritingPipeline(get_registry=lambda chat_id: registry, research=MagicMock())
+        pipeline._nuntius = MagicMock()
+        pipeline._nuntius.write = AsyncMock(side_effect=drafts)
+        pipeline._cogitator = MagicMock()
+        pipeline._cogitator.review = AsyncMock(side_effect=reviews)
+        pipeline._build_writing_context = AsyncMock(return_value="context")
+        return pipeline
+
+    async def _run(self, pipeline, max_review_calls=2):
+        deps = AgentDeps(update_chat=AsyncMock(), user_input="q")
+        with patch("src.ai.SPECULATIVE_REDRAFT", True), \
+                patch("src.ai.MAX_REVIEW_CALLS", max_review_calls), \
+                patch("src.ai.get_query_embedding", AsyncMock(return_value=None)), \
+                patch("src.ai.SKIP_SHORT_REVIEW", False):
+            return await pipeline.write_and_review(deps)
+
+    async def test_rejected_review_uses_speculative_draft(self):
+        pipeline = self._make_pipeline(["first", "speculative"], ["IMPROVE: tighten", "APPROVED"])
+        assert await self._run(pipeline) == "speculative"
+        assert pipeline._nuntius.write.await_count == 2
+
+    async def test_approved_review_keeps_first_draft(self):
+        pipeline = self._make_pipeline(["first", "speculative"], ["APPROVED"])
+        assert await self._run(pipeline) == "first"
+
+    async def test_last_round_revises_from_feedback(self):
+        pipeline = self._make_pipeline(["first", "revised"], ["IMPROVE: tighten"])
+        assert await self._run(pipeline, max_review_calls=1) == "revised"
+        assert "Reviewer Feedback:\nIMPROVE: tighten" in pipeline._nuntius.write.await_args.args[1]
+
+    async def test_unused_draft_cancelled_and_awaited(self):
+        import asyncio
+        cancelled = []
+
+        async def write(user_input, context, **kwargs):
+            if write.calls:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+            write.calls += 1
+            return "first"
+        write.calls = 0
+
+        pipeline = self._make_pipeline([], ["APPROVED"])
+        pipeline._nuntius.write = write
+        assert await self._run(pipeline) == "first"
+        assert cancelled == [True]
@@ -11,6 +11,8 @@ from pydantic_ai.messages import (
     SystemPromptPart,
 )
 
+from unittest.mock import patch
+
 from src.chat_history import ChatHistoryManager
 
 
@@ -145,6 +147,61 @@ def test_many_turns_answer_content_preserved():
     assert len(history) <= mgr.MAX_HISTORY
 
 
+def test_trimmed_history_never_starts_with_model_response():
+    mgr = ChatHistoryManager()
+    # One oversized turn: the raw tail slice would begin on a ModelResponse
+    turn = make_turn("Q", "A", n_intermediate=mgr.MAX_HISTORY + 5)
+    mgr.update(chat_id=1, messages=turn)
+    history = mgr.get(chat_id=1)
+    assert len(history) <= mgr.MAX_HISTORY
+    assert not history or isinstance(history[0], ModelRequest)
+
+
+def test_long_history_keeps_latest_turns_after_tail_slice():
+    mgr = ChatHistoryManager()
+    messages = []
+    for i in range(mgr.MAX_HISTORY * 2):
+        messages.extend(make_turn(f"Q{i}", f"Answer{i}"))
+    mgr.update(chat_id=1, messages=messages)
+    history = mgr.get(chat_id=1)
+    assert isinstance(history[0], ModelRequest)
+    assert history[-1].parts[0].content == f"Answer{mgr.MAX_HISTORY * 2 - 1}"
+    assert len(history) <= mgr.MAX_HISTORY
+
+
+def test_compressed_turn_is_reused():
+    mgr = ChatHistoryManager()
+    turn = [user_msg("Q"), assistant_msg("A")]
+    assert mgr._compress_turn(turn) is turn
+
+
+def test_blank_answer_turn_not_treated_as_compressed():
+    mgr = ChatHistoryManager()
+    assert mgr._compress_turn([user_msg("Q"), assistant_msg("   ")]) == []
+
+
+def test_least_recently_updated_chat_evicted():
+    mgr = ChatHistoryManager()
+    with patch("src.chat_history.MAX_CHATS", 2):
+        mgr.update(chat_id=1, messages=make_turn("Q1", "A1"))
+        mgr.update(chat_id=2, messages=make_turn("Q2", "A2"))
+        mgr.update(chat_id=1, messages=make_turn("Q1b", "A1b"))
+        mgr.update(chat_id=3, messages=make_turn("Q3", "A3"))
+    assert mgr.get(chat_id=2) == []
+    assert mgr.get(chat_id=1) and mgr.get(chat_id=3)
+
+
+def test_read_counts_as_recent_use():
+    mgr = ChatHistoryManager()
+    with patch("src.chat_history.MAX_CHATS", 2):
+        mgr.update(chat_id=1, messages=make_turn("Q1", "A1"))
+        mgr.update(chat_id=2, messages=make_turn("Q2", "A2"))
+        assert mgr.get(chat_id=1)
+        mgr.update(chat_id=3, messages=make_turn("Q3", "A3"))
+    assert mgr.get(chat_id=2) == []
+    assert mgr.get(chat_id=1) and mgr.get(chat_id=3)
+
+
 # ---------------------------------------------------------------------------
 # Update is idempotent / accumulates correctly
 # ---------------------------------------------------------------------------
@@ -4,15 +4,21 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from geopy.exc import GeocoderServiceError
 
-from src.tools.geocoding import GeocodingClient
+import importlib
+
+from src.tools.geocoding import GeocodingClient, location_to_zipcode
+
+geocoding = importlib.import_module("src.tools.geocoding")
 
 pytestmark = pytest.mark.unit
 
 
-def _make_coordinates(lat=40.7128, lon=-74.0060):
+def _make_coordinates(lat=40.7128, lon=-74.0060, postcode=None):
     coords = MagicMock()
     coords.latitude = lat
     coords.longitude = lon
+    # City-level Photon matches carry no postcode
+    coords.raw = {"properties": {"postcode": postcode} if postcode else {}}
     return coords
 
 
@@ -59,6 +65,19 @@ class TestLocationToZipcodeSuccess:
         client.geocode.assert_called_once_with("San Francisco, CA")
 
 
+class TestLocationToZipcodeForwardPostcode:
+    async def test_postcode_on_geocode_result_skips_reverse(self):
+        coords = _make_coordinates(postcode="02139")
+        client = await _make_client(geocode_result=coords, reverse_results=None)
+
+        with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await client.location_to_zipcode("02139")
+
+        assert result == "02139"
+        client.reverse.assert_not_called()
+        sleep.assert_not_called()
+
+
 class TestLocationToZipcodeOffsetRetry:
     async def test_no_postcode_first_reverse_triggers_offset_retry(self):
         coords = _make_coordinates()
@@ -137,3 +156,38 @@ class TestGeocodingConstants:
 
     def test_retry_delay(self):
         assert GeocodingClient.RETRY_DELAY == 7
+
+
+class TestModuleLocationToZipcode:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        geocoding._zipcode_cache.clear()
+        yield
+        geocoding._zipcode_cache.clear()
+        geocoding._client = geocoding._client_loop = None
+
+    async def test_repeat_location_served_from_cache(self):
+        client = MagicMock()
+        client.location_to_zipcode = AsyncMock(return_value="10001")
+        with patch.object(geocoding, "_get_client", return_value=client):
+            assert await location_to_zipcode("New York, NY") == "10001"
+            assert await location_to_zipcode("  new york, ny ") == "10001"
+        client.location_to_zipcode.assert_awaited_once()
+
+    async def test_misses_not_cached(self):
+        client = MagicMock()
+        client.location_to_zipcode = AsyncMock(return_value=None)
+        with patch.object(geocoding, "_get_client", return_value=client):
+            await location_to_zipcode("Nowhere")
+            await location_to_zipcode("Nowhere")
+        assert client.location_to_zipcode.await_count == 2
+
+    async def test_expired_entry_refetched(self):
+        client = MagicMock()
+        client.location_to_zipcode = AsyncMock(return_value="10001")
+        geocoding._zipcode_cache["nyc"] = (0.0, "99999")
+        with patch.object(geocoding, "_get_client", return_value=client):
+            assert await location_to_zipcode("NYC") == "10001"
+
+    async def test_client_shared_between_calls(self):
+        assert geocoding._get_client() is geocoding._get_client()
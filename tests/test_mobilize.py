@@ -28,7 +28,7 @@ class TestBuildParams:
     def test_event_types_present(self):
         params = build_params("10001")
         assert "event_types" in params
-        assert isinstance(params["event_types"], list)
+        assert isinstance(params["event_types"], tuple)
         assert len(params["event_types"]) > 0
 
     def test_rally_in_event_types(self):
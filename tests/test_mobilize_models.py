@@ -85,6 +85,9 @@ class TestEventType:
     def test_canvass_accessible(self):
         assert EventType.CANVASS.value == "CANVASS"
 
+    def test_compares_equal_to_raw_string(self):
+        assert EventType.RALLY == "RALLY"
+
 
 # ---------------------------------------------------------------------------
 # Timeslot — int timestamp → datetime
@@ -191,6 +194,19 @@ class TestEventLlmContext:
         event = Event(**_make_event())
         assert "\n" in event.llm_context
 
+    @pytest.mark.parametrize("hour", [0, 9, 12, 23])
+    def test_dates_match_strftime(self, hour):
+        event = Event(**_make_event())
+        start = datetime(2024, 3, 7, hour, 5)
+        event.timeslots[0].start_date = start
+        assert event.short_date == start.strftime('%Y-%m-%d %H:%M')
+        assert event.long_date == start.strftime('%A, %B %d, %Y at %I:%M %p')
+
+    def test_rendered_once(self):
+        event = Event(**_make_event())
+        assert event.llm_context is event.llm_context
+        assert "llm_context" not in event.model_dump()
+
 
 # ---------------------------------------------------------------------------
 # Event.telegram_message
@@ -4,7 +4,7 @@ import pytest
 import httpx
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.ollama_transport import OllamaRetryTransport
+from src.ollama_transport import OllamaRetryTransport, ollama_http_client, warm_up_ollama
 
 pytestmark = pytest.mark.unit
 
@@ -79,47 +79,25 @@ class TestSanitizeRequest:
         result = self.transport._sanitize_request(req)
         assert result is req  # no null → same request object
 
+    def test_other_bytes_preserved(self):
+        content = b'{"messages": [{"role": "assistant", "content": null, "x": "\\"content\\":null"}]}'
+        req = httpx.Request("POST", "http://localhost/v1/chat", content=content)
+        result = self.transport._sanitize_request(req)
+        assert result.content == content.replace(b'"content": null', b'"content": ""', 1)
+        assert result.headers["content-length"] == str(len(result.content))
 
-# ---------------------------------------------------------------------------
-# fix_request
-# ---------------------------------------------------------------------------
-
-class TestFixRequest:
-    def setup_method(self):
-        self.transport = OllamaRetryTransport()
-
-    def test_compact_json_body_written(self):
-        body = {"messages": [{"role": "user", "content": ""}]}
-        req = make_request(body)
-        fixed = self.transport.fix_request(req, body)
-        # Should be compact (no spaces after separators)
-        assert b" " not in fixed.content or json.loads(fixed.content)
-
-    def test_method_preserved(self):
-        body = {"messages": []}
-        req = make_request(body, method="POST")
-        fixed = self.transport.fix_request(req, body)
-        assert fixed.method == "POST"
-
-    def test_url_preserved(self):
-        url = "http://localhost:11434/v1/chat/completions"
-        body = {"messages": []}
-        req = make_request(body, url=url)
-        fixed = self.transport.fix_request(req, body)
-        assert str(fixed.url) == url
-
-    def test_content_length_header_updated(self):
-        body = {"messages": [{"role": "user", "content": "hello world"}]}
-        req = make_request(body)
-        fixed = self.transport.fix_request(req, body)
-        expected_len = len(json.dumps(body, separators=(',', ':')).encode())
-        assert fixed.headers["content-length"] == str(expected_len)
+    def test_compact_null_content_replaced(self):
+        req = httpx.Request("POST", "http://localhost/v1/chat",
+                            content=b'{"messages":[{"role":"assistant","content":null}]}')
+        result = self.transport._sanitize_request(req)
+        assert json.loads(result.content)["messages"][0]["content"] == ""
 
-    def test_original_headers_preserved(self):
-        body = {"messages": []}
+    def test_null_content_inside_string_untouched(self):
+        # the second key serializes as "a\"content": null
+        body = {"messages": [{"role": "user", "content": 'say {"content":null}'}], 'a"content': None}
         req = make_request(body)
-        fixed = self.transport.fix_request(req, body)
-        assert "content-type" in dict(fixed.headers)
+        result = self.transport._sanitize_request(req)
+        assert result is req
 
 
 # ---------------------------------------------------------------------------
@@ -159,6 +137,20 @@ class TestHandleAsyncRequest:
         assert result.status_code == 500
         assert self.transport._transport.handle_async_request.call_count == OllamaRetryTransport.MAX_RETRIES
 
+    @pytest.mark.asyncio
+    async def test_500_retries_back_off_exponentially(self):
+        response_500 = make_response(500)
+        response_500.aread = AsyncMock(return_value=b"")
+        self.transport._transport = MagicMock()
+        self.transport._transport.handle_async_request = AsyncMock(return_value=response_500)
+
+        with patch("src.ollama_transport.asyncio.sleep", AsyncMock()) as sleep:
+            await self.transport.handle_async_request(make_request({"messages": []}))
+
+        delays = [c.args[0] for c in sleep.await_args_list]
+        base = OllamaRetryTransport.RETRY_BACKOFF
+        assert delays == [base * 2 ** i for i in range(OllamaRetryTransport.MAX_RETRIES - 1)]
+
     @pytest.mark.asyncio
     async def test_500_then_200_succeeds(self):
         response_500 = make_response(500)
@@ -215,3 +207,38 @@ class TestHandleAsyncRequest:
 
         assert result.status_code == 400
         self.transport._transport.handle_async_request.assert_called_once()
+
+
+class TestAclose:
+    @pytest.mark.asyncio
+    async def test_closing_client_closes_inner_transport(self):
+        transport = OllamaRetryTransport()
+        transport._transport.aclose = AsyncMock()
+        client = httpx.AsyncClient(transport=transport)
+        await client.aclose()
+        transport._transport.aclose.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# warm_up_ollama
+# ---------------------------------------------------------------------------
+
+class TestWarmUpOllama:
+    @pytest.mark.asyncio
+    async def test_requests_tags_endpoint(self):
+        with patch.object(ollama_http_client, "get", AsyncMock()) as mock_get:
+            await warm_up_ollama("http://localhost:11434/")
+        assert mock_get.call_args.args[0] == "http://localhost:11434/api/tags"
+
+    @pytest.mark.asyncio
+    async def test_connection_error_is_swallowed(self):
+        error = httpx.ConnectError("refused")
+        with patch.object(ollama_http_client, "get", AsyncMock(side_effect=error)):
+            await warm_up_ollama("http://localhost:11434")
+
+    @pytest.mark.asyncio
+    async def test_non_http_error_is_swallowed(self):
+        error = httpx.InvalidURL("bad url")
+        assert not isinstance(error, httpx.HTTPError)
+        with patch.object(ollama_http_client, "get", AsyncMock(side_effect=error)):
+            await warm_up_ollama("http://localhost:11434")
@@ -70,6 +70,29 @@ class TestResolvePublishedDate:
         result = RSSFeedItem._resolve_published_date(entry)
         assert result is None
 
+    def test_repeated_date_string_parsed_once(self):
+        from src.tools.rss import models
+        value = "Tue, 09 Jan 2024 07:15:00 GMT"
+        models._parse_cached.cache_clear()
+        first = RSSFeedItem._resolve_published_date({"published": value})
+        second = RSSFeedItem._resolve_published_date({"published": value})
+        assert first == second
+        assert models._parse_cached.cache_info().hits == 1
+
+    @pytest.mark.parametrize("value", [
+        "Tue, 09 Jan 2024 07:15:00 GMT",
+        "Tue, 09 Jan 2024 07:15:00 -0500",
+        "2024-01-15T12:00:00Z",
+    ])
+    def test_common_formats_skip_dateutil(self, value):
+        from unittest.mock import patch
+        from src.tools.rss import models
+        models._parse_cached.cache_clear()
+        with patch("src.tools.rss.models.parse_date") as dateutil_parse:
+            result = RSSFeedItem._resolve_published_date({"published": value})
+        dateutil_parse.assert_not_called()
+        assert result.tzinfo is not None
+
 
 # ---------------------------------------------------------------------------
 # age property
@@ -121,3 +121,12 @@ class TestLogDir:
         importlib.reload(settings)
         assert settings.LOG_DIR.exists()
 
+
+
+class TestRSSFeeds:
+    def test_feed_json_parsed_on_first_access(self):
+        from src.settings import _RSSFeeds
+        feeds = _RSSFeeds()
+        assert "US_GOV_JSON" not in feeds.__dict__
+        assert feeds.US_GOV_JSON is feeds.US_GOV_JSON
+        assert "US_GOV_JSON" in feeds.__dict__
@@ -5,7 +5,10 @@ from src.source_registry import (
     SourceDataBuilder,
     _classify_primary,
     _cosine_similarity,
+    _sourceable_fields,
+    _SOURCEABLE_TYPES,
 )
+from dataclasses import dataclass
 
 pytestmark = pytest.mark.unit
 
@@ -128,6 +131,51 @@ class TestSourceNameFallback:
         assert "[Article One](https://example.com/1)" in result
         assert "(Reuters)" not in result
 
+    def test_substituted_link_not_rescanned(self):
+        """A source name inside an inserted link title is left alone."""
+        reg = SourceRegistry()
+        tag = reg.register("https://example.com/1", title="Quote (BBC)")
+        reg.register("https://example.com/2", title="Other", source_name="BBC")
+        result = reg.substitute(f"See {tag}.")
+        assert result == "See [Quote (BBC)](https://example.com/1)."
+
+
+class TestSubstitutionPattern:
+    def test_pattern_reused_between_calls(self, registry):
+        registry.substitute("[SOURCE_1]")
+        cache = registry._sub_cache
+        registry.substitute("[SOURCE_2]")
+        assert registry._sub_cache is cache
+
+    def test_register_invalidates_pattern(self, registry):
+        registry.substitute("[SOURCE_1]")
+        tag = registry.register("https://example.com/4", title="Article Four")
+        assert registry.substitute(tag) == "[Article Four](https://example.com/4)"
+
+    def test_eviction_drops_evicted_tag(self, monkeypatch):
+        monkeypatch.setattr(SourceRegistry, "MAX_SIZE", 2)
+        reg = SourceRegistry()
+        first = reg.register("https://a.com", title="A")
+        reg.register("https://b.com", title="B")
+        assert reg.substitute(first) == "[A](https://a.com)"
+        reg.register("https://c.com", title="C")
+        assert reg.substitute(first) == ""
+
+    def test_plain_text_returned_unchanged(self, registry):
+        text = "No citations here."
+        assert registry.substitute(text) is text
+        assert registry._sub_cache is None
+
+    def test_name_fallback_without_tags(self, registry):
+        result = registry.substitute("Confirmed (BBC) today.")
+        assert result == "Confirmed [Article Two](https://example.com/2) today."
+
+    def test_duplicate_register_keeps_pattern(self, registry):
+        registry.substitute("[SOURCE_1]")
+        cache = registry._sub_cache
+        registry.register("https://example.com/1")
+        assert registry._sub_cache is cache
+
 
 class TestHallucinatedTags:
     def test_hallucinated_tag_stripped(self, registry):
@@ -276,6 +324,66 @@ class TestCosineSimilarity:
         assert result == pytest.approx(1.0)
 
 
+@dataclass
+class _Post:
+    title: str
+    body: str
+    summary: str
+    author_handle: str
+
+    @property
+    def source_url(self) -> str:
+        return f"https://example.com/{self.title}"
+
+
+class TestSourceableFields:
+    def test_falls_back_to_first_truthy_attr(self):
+        post = _Post(title="t", body="", summary="short", author_handle="alice")
+        assert _sourceable_fields(post) == ("https://example.com/t", "t", "alice", "short")
+
+    def test_description_truncated(self):
+        post = _Post(title="t", body="x" * 50_000, summary="", author_handle="")
+        assert _sourceable_fields(post)[3] == "x" * 200
+
+    def test_sourceable_check_cached_per_type(self):
+        _sourceable_fields(_Post("a", "b", "", "c"))
+        assert _SOURCEABLE_TYPES[_Post] is True
+
+    def test_later_instance_missing_optional_attrs(self):
+        first = _Post("a", "b", "", "c")
+        later = _Post("d", "e", "", "f")
+        del later.body, later.author_handle
+        assert _sourceable_fields(first) == ("https://example.com/a", "a", "c", "b")
+        assert _sourceable_fields(later) == ("https://example.com/d", "d", "", "")
+
+    def test_non_sourceable_returns_none(self):
+        assert _sourceable_fields("plain string") is None
+        assert _SOURCEABLE_TYPES[str] is False
+
+
+class TestSourceItemSlots:
+    def test_no_instance_dict(self):
+        item = SourceItem(url="https://a.com")
+        assert not hasattr(item, "__dict__")
+
+    def test_mutable_fields_still_assignable(self):
+        item = SourceItem(url="https://a.com")
+        item.corroboration_count += 1
+        item.embedding = [0.1]
+        assert item.corroboration_count == 2
+
+
+class TestSourceItemRendered:
+    def test_rendered_link_built_on_init(self):
+        item = SourceItem(url="https://a.com", title="A")
+        assert item.rendered == "[A](https://a.com)"
+
+    def test_register_renders_default_title(self):
+        reg = SourceRegistry()
+        tag = reg.register("https://a.com")
+        assert reg.lookup_by_key(tag).rendered == "[Source](https://a.com)"
+
+
 class TestSourceItemConfidenceLevel:
     def test_high_corroboration(self):
         item = SourceItem(url="https://a.com", corroboration_count=3)
@@ -450,3 +558,60 @@ class TestSourceDataBuilderIsRelevant:
             source_url = ""
             source = ""
         assert SourceDataBuilder._is_relevant(FakeItem(), "anything") is False
+
+
+class TestSourceDataBuilderBuild:
+    def test_build_registers_tool_returns(self):
+        from pydantic_ai.messages import ModelRequest, ToolReturnPart, UserPromptPart
+        post = _Post(title="t", body="body text", summary="", author_handle="alice")
+        messages = [
+            ModelRequest(parts=[UserPromptPart(content="hi")]),
+            ModelRequest(parts=[
+                ToolReturnPart(tool_name="search", content=[post], tool_call_id="1"),
+                ToolReturnPart(tool_name="search_wikipedia", content="ctx", tool_call_id="2"),
+            ]),
+        ]
+        reg = SourceRegistry()
+        text = SourceDataBuilder().build(messages, reg)
+        assert "[search]:" in text
+        assert "- [SOURCE_1] t [via alice] [LOW]: body text" in text
+        assert "search_wikipedia" not in text
+
+    def test_build_without_tool_returns(self):
+        assert SourceDataBuilder().build([], SourceRegistry()) == ""
+
+
+class TestConcurrentRegister:
+    def test_threads_never_duplicate_tags(self):
+        from concurrent.futures import ThreadPoolExecutor
+        reg = SourceRegistry()
+        urls = [f"https://example.com/{i % 50}" for i in range(400)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            tags = list(pool.map(reg.register, urls))
+        assert len(set(tags)) == 50
+        assert len(reg._sources) == 50
+
+    def test_readers_tolerate_concurrent_registration(self):
+        import threading
+        reg = SourceRegistry()
+        for i in range(100):
+            reg.register(f"https://example.com/seed/{i}", title=f"Seed {i}")
+        stop = threading.Event()
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                reg.register(f"https://example.com/live/{i}")
+                i += 1
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            for _ in range(200):
+                reg.format_for_user()
+                reg.format_for_agent_semantic()
+                reg.source_map
+        finally:
+            stop.set()
+            thread.join()
+        assert reg.size == len(reg._sources) <= SourceRegistry.MAX_SIZE
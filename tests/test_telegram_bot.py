@@ -14,7 +14,10 @@ for _mod in [
 # Patch Praetor to avoid loading pydantic-ai agents and Ollama transport
 with patch("src.ai.Praetor", MagicMock()), \
      patch("src.ai.training_logger", MagicMock()):
-    from src.telegram_bot import is_authorized, markdown_to_html, send_long_message
+    from src.telegram_bot import (
+        is_authorized, markdown_to_html, send_long_message, get_bot_username,
+        _split_oversized,
+    )
 
 from src.settings import TelegramBotCredentials
 
@@ -220,3 +223,43 @@ class TestSendLongMessage:
         await send_long_message(msg, text, chunk_size=400)
         # Should have sent multiple chunks
         assert msg.answer.call_count > 1
+
+    @pytest.mark.asyncio
+    async def test_oversized_paragraph_split_on_word_boundary(self):
+        msg = self._make_msg_mock()
+        text = "**bold** " * 100  # one 900-char paragraph
+        await send_long_message(msg, text, chunk_size=400)
+        for call in msg.answer.call_args_list:
+            html = call.args[0]
+            assert html.count("<b>") == html.count("</b>")
+            assert "*" not in html
+
+
+class TestSplitOversized:
+    def test_pieces_within_limit(self):
+        pieces = list(_split_oversized("word " * 100, 64))
+        assert all(len(p) <= 64 for p in pieces)
+        assert "".join(pieces) == "word " * 100
+
+    def test_prefers_newline(self):
+        pieces = list(_split_oversized("aaaa bbbb\ncccc dddd", 12))
+        assert pieces[0] == "aaaa bbbb"
+
+    def test_hard_cut_without_whitespace(self):
+        assert list(_split_oversized("x" * 10, 4)) == ["xxxx", "xxxx", "xx"]
+
+
+# ---------------------------------------------------------------------------
+# get_bot_username
+# ---------------------------------------------------------------------------
+
+class TestGetBotUsername:
+    @pytest.mark.asyncio
+    async def test_get_me_called_once(self):
+        fake_bot = MagicMock()
+        fake_bot.get_me = AsyncMock(return_value=MagicMock(username="oculis_bot"))
+        with patch("src.telegram_bot.bot", fake_bot), \
+             patch("src.telegram_bot._bot_username", None):
+            assert await get_bot_username() == "@oculis_bot"
+            assert await get_bot_username() == "@oculis_bot"
+        fake_bot.get_me.assert_awaited_once()
@@ -1,6 +1,7 @@
 """Tests for Bluesky models and sanitize_handle in src/tools/bsky.py."""
+import asyncio
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, AsyncMock, patch
 from urllib.parse import quote
 
 from src.tools.bsky import (
@@ -8,6 +9,12 @@ from src.tools.bsky import (
     BlueskyPost,
     BlueskyProfile,
     BlueskyTrendingTopic,
+    get_client,
+    reset_client,
+    reset_on_auth_error,
+    close_client,
+    bluesky_login,
+    get_bluesky_profile_and_feed,
 )
 
 pytestmark = pytest.mark.unit
@@ -33,6 +40,15 @@ class TestSanitizeHandle:
     def test_did_handle_unchanged(self):
         assert sanitize_handle("did:plc:abc123") == "did:plc:abc123"
 
+    def test_did_handle_whitespace_stripped(self):
+        assert sanitize_handle(" did:plc:abc123 ") == "did:plc:abc123"
+
+    def test_result_cached(self):
+        sanitize_handle.cache_clear()
+        sanitize_handle("carol")
+        sanitize_handle("carol")
+        assert sanitize_handle.cache_info().hits == 1
+
     def test_custom_domain_unchanged(self):
         # TODO: production bug — custom domains (e.g. "alice.custom.domain")
         # incorrectly get ".bsky.social" appended because the code only checks
@@ -78,6 +94,11 @@ class TestBlueskyPostFromAtproto:
         result = BlueskyPost.from_atproto(post)
         assert result.post_id == "3abc"
 
+    def test_matches_validated_model(self):
+        result = BlueskyPost.from_atproto(self._make_atproto_post())
+        expected = BlueskyPost(author_handle="alice.bsky.social", text="Hello world", post_id="abc123")
+        assert result.model_dump() == expected.model_dump()
+
 
 # ---------------------------------------------------------------------------
 # BlueskyPost.source_url
@@ -104,6 +125,16 @@ class TestBlueskyPostSourceUrl:
         post = BlueskyPost(author_handle="h", text="t", post_id="p")
         assert post.url == post.source_url
 
+    def test_source_url_built_once(self):
+        post = BlueskyPost(author_handle="h", text="t", post_id="p")
+        assert post.source_url is post.url
+
+    def test_str_format(self):
+        post = BlueskyPost(author_handle="h", text="t", post_id="p")
+        assert str(post) == (
+            "Author: h\nContent: t\nURL: https://bsky.app/profile/h/post/p\n---------"
+        )
+
 
 # ---------------------------------------------------------------------------
 # BlueskyProfile.source_url
@@ -174,3 +205,164 @@ class TestBlueskyTrendingTopicSourceUrl:
     def test_summary_empty_when_no_description(self):
         topic = BlueskyTrendingTopic(topic="t", link="/")
         assert topic.summary == ""
+
+
+# ---------------------------------------------------------------------------
+# get_client
+# ---------------------------------------------------------------------------
+
+class TestGetClient:
+    @pytest.fixture(autouse=True)
+    def _fresh_client(self):
+        reset_client()
+        yield
+        reset_client()
+
+    @pytest.mark.asyncio
+    async def test_logs_in_once(self):
+        login = AsyncMock(return_value=MagicMock())
+        with patch("src.tools.bsky.bluesky_login", login):
+            first = await get_client()
+            second = await get_client()
+        assert first is second
+        login.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_login(self):
+        async def slow_login():
+            await asyncio.sleep(0)
+            return MagicMock()
+        login = AsyncMock(side_effect=slow_login)
+        with patch("src.tools.bsky.bluesky_login", login):
+            clients = await asyncio.gather(*(get_client() for _ in range(5)))
+        assert len({id(c) for c in clients}) == 1
+        login.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reset_forces_new_login(self):
+        login = AsyncMock(side_effect=[MagicMock(), MagicMock()])
+        with patch("src.tools.bsky.bluesky_login", login):
+            first = await get_client()
+            reset_client()
+            second = await get_client()
+        assert first is not second
+        assert login.await_count == 2
+
+    def _error(self, cls, error_code=None):
+        from atproto_client.request import Response
+        content = MagicMock(error=error_code) if error_code else None
+        return cls(Response(success=False, status_code=400, content=content, headers={}))
+
+    def test_auth_errors_reset_session(self):
+        from atproto_client.exceptions import BadRequestError, UnauthorizedError
+        for error in (
+            self._error(UnauthorizedError),
+            self._error(BadRequestError, "ExpiredToken"),
+        ):
+            with patch("src.tools.bsky.reset_client") as reset:
+                reset_on_auth_error(error)
+            reset.assert_called_once()
+
+    def test_other_errors_keep_session(self):
+        from atproto_client.exceptions import (
+            BadRequestError, NetworkError, RateLimitExceededError,
+        )
+        for error in (
+            self._error(BadRequestError, "InvalidRequest"),
+            self._error(BadRequestError),
+            self._error(RateLimitExceededError),
+            self._error(NetworkError),
+        ):
+            with patch("src.tools.bsky.reset_client") as reset:
+                reset_on_auth_error(error)
+            reset.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_client_closes_pool(self):
+        client = MagicMock()
+        client.request.close = AsyncMock()
+        with patch("src.tools.bsky.bluesky_login", AsyncMock(return_value=client)):
+            await get_client()
+        await close_client()
+        client.request.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_login_uses_keepalive_pool(self):
+        with patch("atproto.AsyncClient.login", AsyncMock()):
+            client = await bluesky_login()
+        pool = client.request._client._transport._pool
+        assert pool._keepalive_expiry == 300
+        await client.request.close()
+
+
+# ---------------------------------------------------------------------------
+# get_bluesky_profile_and_feed
+# ---------------------------------------------------------------------------
+
+def _fake_profile():
+    p = MagicMock()
+    p.display_name = "Alice"
+    p.description = "bio"
+    p.followers_count = 5
+    p.follows_count = 2
+    p.posts_count = 9
+    return p
+
+
+def _fake_feed(n: int):
+    feed = MagicMock()
+    feed.feed = []
+    for i in range(n):
+        item = MagicMock()
+        item.post.uri = f"at://did:plc:abc/app.bsky.feed.post/{i}"
+        item.post.author.handle = "alice.bsky.social"
+        item.post.record.text = f"post {i}"
+        feed.feed.append(item)
+    return feed
+
+
+class TestGetProfileAndFeed:
+    def _ctx(self):
+        ctx = MagicMock()
+        ctx.deps.update_chat = AsyncMock()
+        ctx.deps.source_registry = None
+        return ctx
+
+    @pytest.mark.asyncio
+    async def test_requests_run_concurrently(self):
+        started = []
+
+        async def get_profile(params):
+            started.append("profile")
+            await asyncio.sleep(0)
+            assert "feed" in started
+            return _fake_profile()
+
+        async def get_feed(params):
+            started.append("feed")
+            await asyncio.sleep(0)
+            return _fake_feed(2)
+
+        client = MagicMock()
+        client.app.bsky.actor.get_profile = get_profile
+        client.app.bsky.feed.get_author_feed = get_feed
+        with patch("src.tools.bsky.get_client", AsyncMock(return_value=client)):
+            results = await get_bluesky_profile_and_feed(self._ctx(), "alice")
+
+        assert isinstance(results[0], BlueskyProfile)
+        assert results[0].handle == "alice.bsky.social"
+        assert [p.post_id for p in results[1:]] == ["0", "1"]
+
+    @pytest.mark.asyncio
+    async def test_failed_profile_keeps_feed(self):
+        from atproto_client.exceptions import BadRequestError
+        client = MagicMock()
+        client.app.bsky.actor.get_profile = AsyncMock(side_effect=BadRequestError())
+        client.app.bsky.feed.get_author_feed = AsyncMock(return_value=_fake_feed(1))
+        with patch("src.tools.bsky.get_client", AsyncMock(return_value=client)), \
+             patch("src.tools.bsky.reset_client") as reset:
+            results = await get_bluesky_profile_and_feed(self._ctx(), "alice")
+        assert len(results) == 1
+        assert isinstance(results[0], BlueskyPost)
+        # an unknown handle is not a reason to log in again
+        reset.assert_not_called()
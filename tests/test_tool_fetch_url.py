@@ -1,15 +1,31 @@
 """Tests for direct and registry-backed page fetching in src/tools/fetch_url.py."""
+import asyncio
+import importlib
+import threading
 import pytest
 from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, AsyncMock
 
 from src.ai import AgentDeps
 from src.source_registry import SourceRegistry
-from src.tools.fetch_url import _extract, FetchedPage, MAX_BODY_CHARS, fetch_webpage
+from src.tools.fetch_url import (
+    _extract, _fetch_page_from_url, _get_page, FetchedPage, MAX_BODY_CHARS, fetch_webpage,
+    BrowserManager,
+)
+
+# src.tools re-exports the fetch_url tool function under the module's name
+fetch_url_module = importlib.import_module("src.tools.fetch_url")
 
 pytestmark = pytest.mark.unit
 
 
+@pytest.fixture(autouse=True)
+def _empty_page_cache():
+    fetch_url_module._page_cache.clear()
+    yield
+    fetch_url_module._page_cache.clear()
+
+
 class TestFetchedPage:
     def test_source_url_equals_url(self):
         page = FetchedPage(url="https://example.com", title="Test", body="content")
@@ -112,3 +128,109 @@ class TestFetchWebpage:
         with patch("src.tools.fetch_url._fetch_page_from_url", AsyncMock(return_value=None)):
             page = await fetch_webpage(ctx, "https://example.com/missing")
         assert page is None
+
+
+class TestFetchPageFromUrl:
+    @pytest.mark.asyncio
+    async def test_download_runs_off_event_loop(self):
+        loop_thread = threading.get_ident()
+        seen = {}
+
+        def fake_fetch(url):
+            seen["thread"] = threading.get_ident()
+            return "<html></html>"
+
+        page = FetchedPage(url="https://example.com", title="T", body="B")
+        with patch("src.tools.fetch_url.trafilatura.fetch_url", fake_fetch), \
+             patch("src.tools.fetch_url._extract", return_value=page):
+            result = await _fetch_page_from_url("https://example.com")
+
+        assert result is page
+        assert seen["thread"] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_extraction_runs_off_event_loop(self):
+        loop_thread = threading.get_ident()
+        seen = {}
+        page = FetchedPage(url="https://example.com", title="T", body="B")
+
+        def fake_extract(html, url):
+            seen["thread"] = threading.get_ident()
+            return page
+
+        with patch("src.tools.fetch_url.trafilatura.fetch_url", return_value="<html></html>"), \
+             patch("src.tools.fetch_url._extract", fake_extract):
+            result = await _fetch_page_from_url("https://example.com")
+
+        assert result is page
+        assert seen["thread"] != loop_thread
+
+
+class TestPageCache:
+    def _page(self):
+        return FetchedPage(url="https://example.com/a", title="T", body="B")
+
+    @pytest.mark.asyncio
+    async def test_repeat_fetch_served_from_cache(self):
+        fetch = AsyncMock(return_value=self._page())
+        with patch("src.tools.fetch_url._fetch_page_from_url", fetch):
+            first = await _get_page("https://example.com/a")
+            second = await _get_page("https://example.com/a")
+        fetch.assert_awaited_once()
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_cached_page_is_copied(self):
+        with patch("src.tools.fetch_url._fetch_page_from_url", AsyncMock(return_value=self._page())):
+            first = await _get_page("https://example.com/a")
+            first.tag = "[SOURCE_1]"
+            second = await _get_page("https://example.com/a")
+        assert second.tag == ""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_fetch(self):
+        async def slow_fetch(url):
+            await asyncio.sleep(0)
+            return self._page()
+        fetch = AsyncMock(side_effect=slow_fetch)
+        with patch("src.tools.fetch_url._fetch_page_from_url", fetch):
+            pages = await asyncio.gather(*(_get_page("https://example.com/a") for _ in range(3)))
+        fetch.assert_awaited_once()
+        assert all(p.title == "T" for p in pages)
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_expires_sooner(self):
+        fetch = AsyncMock(return_value=None)
+        with patch("src.tools.fetch_url._fetch_page_from_url", fetch), \
+             patch("src.tools.fetch_url.time.monotonic", return_value=1000.0):
+            assert await _get_page("https://example.com/bad") is None
+            assert await _get_page("https://example.com/bad") is None
+        assert fetch.await_count == 1
+        expires_at, _ = fetch_url_module._page_cache["https://example.com/bad"]
+        assert expires_at == 1000.0 + fetch_url_module.FAILED_FETCH_TTL
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_refetched(self):
+        fetch = AsyncMock(return_value=self._page())
+        with patch("src.tools.fetch_url._fetch_page_from_url", fetch):
+            await _get_page("https://example.com/a")
+            fetch_url_module._page_cache["https://example.com/a"] = (0.0, self._page())
+            await _get_page("https://example.com/a")
+        assert fetch.await_count == 2
+
+
+class TestBrowserManager:
+    @pytest.mark.asyncio
+    async def test_fetch_reuses_context_and_closes_page(self):
+        manager = BrowserManager()
+        page = MagicMock()
+        page.goto = AsyncMock()
+        page.content = AsyncMock(return_value="<html></html>")
+        page.close = AsyncMock()
+        context = MagicMock()
+        context.new_page = AsyncMock(return_value=page)
+        with patch.object(manager, "_get_context", AsyncMock(return_value=context)):
+            assert await manager.fetch("https://example.com") == "<html></html>"
+            await manager.fetch("https://example.com/2")
+        assert context.new_page.await_count == 2
+        assert page.close.await_count == 2
@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, patch
 
 import aiohttp
 
-from src.tools.http_client import AsyncHTTPClient
+from src.tools.http_client import AsyncHTTPClient, get_shared_session, close_shared_session
 
 pytestmark = pytest.mark.unit
 
@@ -112,3 +112,27 @@ class TestMaxRetries:
 
     def test_retry_delay_constant(self):
         assert AsyncHTTPClient.RETRY_DELAY == 7
+
+
+class TestHttpRequest:
+    async def test_decodes_with_fast_loads(self):
+        from unittest.mock import MagicMock
+        import orjson
+        response = MagicMock(status=200)
+        response.json = AsyncMock(return_value={"ok": True})
+        client = ConcreteClient()
+        client.session = MagicMock()
+        client.session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+        client.session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+        assert await client.http_request(url="https://x", params={}) == (200, {"ok": True})
+        response.json.assert_awaited_once_with(loads=orjson.loads)
+
+
+class TestSharedSession:
+    async def test_clients_reuse_one_session(self):
+        async with ConcreteClient() as a, ConcreteClient() as b:
+            assert a.session is b.session
+        session = get_shared_session()
+        assert not session.closed
+        await close_shared_session()
+        assert session.closed